@@ -12,8 +12,10 @@ Modules:
 - `type_engine`: Defines the type engines used in the computation process.
 - `DataUnit`: Represents a data unit used for computation.
 - `DataTable`: Defines a data table structure to hold and manage data.
+- `ChunkedTable`: Reads a table larger than memory from disk in chunks and runs blocks over it.
 - `CalBlock`: Defines the basic block of a computational workflow.
 - `CalBlockRemote`: Defines a remote version of the `CalBlock` for distributed computation.
+- `CalBlockBalanced`: Defines a `CalBlock` balancing a remote algorithm across several hosts.
 - `CalBlockLib`: Contains the libraries for working with `CalBlock` units.
 - `RemoteCalBlockLib`: Defines remote computation blocks for API interaction.
 - `LocalCalBlockLib`: Defines local computation blocks for API interaction.
@@ -29,9 +31,11 @@ from .type_engine import FileUnit  # Import FileUnit class from type_engine
 
 from ._data_unit import DataUnit  # Import DataUnit class for data computation
 from ._data_table import DataTable  # Import DataTable class to manage tables
+from ._chunked_table import ChunkedTable  # Import ChunkedTable class to process on-disk tables in chunks
 
 from .calblock import CalBlock  # Import CalBlock class for computational blocks
 from .calblock import CalBlockRemote  # Import CalBlockRemote for remote computation blocks
+from .calblock import CalBlockBalanced  # Import CalBlockBalanced for multi-host remote computation blocks
 
 from .calblock._lib import CalBlockLib  # Import CalBlockLib for block library management
 from .calblock._lib import RemoteCalBlockLib  # Import RemoteCalBlockLib for remote computation blocks
@@ -44,14 +48,20 @@ from easyaccess.parameter import IOType  # Import IOType for input/output type d
 from .extented_blocks import *
 # main_package/__init__.py
 
-import pkg_resources
+from importlib.metadata import entry_points
 
 def load_extensions():
     """
     Automatically load all registered extensions for the main package.
-    Extensions must declare themselves in the entry point `caltable.extensions`.
+    Extensions declared in the entry point `caltable.extensions` are imported immediately.
+    Blocks declared in `caltable.blocks` (named by block name) and engines declared in
+    `caltable.engines` (named by iotype id) are only imported when first used.
     """
-    for entry_point in pkg_resources.iter_entry_points('caltable.extensions'):
+    for entry_point in entry_points(group='caltable.blocks'):
+        LocalCalBlockLib.register_lazy(entry_point.name, entry_point)
+    for entry_point in entry_points(group='caltable.engines'):
+        DataUnit.register_lazy(entry_point.name, entry_point)
+    for entry_point in entry_points(group='caltable.extensions'):
         try: entry_point.load()
         except Exception as e:
             import warnings
@@ -0,0 +1,269 @@
+"""
+ChunkedTable Module
+
+The ChunkedTable module provides out-of-core processing of tables larger than memory. A `ChunkedTable`
+reads rows from an on-disk source in fixed-size chunks, each chunk being a regular `DataTable`, and
+`forward` passes every chunk through a block or workflow and appends the results to an on-disk sink,
+so memory is bounded by the chunk size.
+
+Classes:
+- ChunkedTable: A table read from CSV, JSON Lines, Parquet, or a directory written by `DataTable.save` (or a directory
+  of such parts written by `forward`), one chunk at a time.
+
+Supported sinks:
+- `.jsonl`: One JSON object per row. Missing numbers (NaN) are written as null.
+- `.csv`: One line per row, with the columns of the first chunk. A later chunk with new columns raises an error.
+  Numeric arrays are written space separated.
+- A directory: One `DataTable.save` directory per chunk, named `part-00000`, `part-00001`, and so on.
+  Parts left by an earlier run are removed first.
+"""
+
+import os
+import csv
+import json
+import math
+import shutil
+import pathlib
+import numpy as np
+from collections import OrderedDict
+
+from ._data_table import DataTable
+from .type_engine import BlobHandle
+
+
+class ChunkedTable(object):
+    """
+    A table read from an on-disk source in chunks of rows.
+
+    Attributes:
+        source (str): The path of the source.
+        format (str): The source format, one of 'csv', 'jsonl', 'parquet', or 'table' (a `DataTable.save` directory).
+        chunksize (int): The number of rows per chunk.
+        columns (list or None): The columns to read, or None to read all columns.
+
+    Methods:
+        __iter__: Iterates over the chunks as `DataTable` objects.
+        forward: Passes every chunk through a block or workflow and writes the results to a sink.
+    """
+
+    def __init__(self, source, chunksize=10000, format=None, columns=None):
+        """
+        Initializes a ChunkedTable instance.
+
+        Args:
+            source (str): The path of the source.
+            chunksize (int, optional): The number of rows per chunk. Defaults to 10000.
+            format (str, optional): The source format. Defaults to the format given by the file extension,
+                or 'table' for a directory.
+            columns (list, optional): The columns to read. Defaults to all columns.
+        """
+        self.source = str(source)
+        self.chunksize = chunksize
+        self.format = self._infer_format(self.source) if format is None else format
+        self.columns = columns
+
+    @staticmethod
+    def _infer_format(path):
+        """
+        Infers the format of a source or sink from its path.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            str: 'csv', 'jsonl', 'parquet', or 'table'.
+
+        Raises:
+            TypeError: If the extension is not supported.
+        """
+        _suffix = pathlib.Path(path).suffix.lower()
+        if _suffix == '' or os.path.isdir(path):
+            return 'table'
+        _formats = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.parquet': 'parquet'}
+        if _suffix not in _formats:
+            raise TypeError(f'{_suffix} Not Supported!')
+        return _formats[_suffix]
+
+    def __repr__(self):
+        """
+        Returns a string representation of the ChunkedTable.
+
+        Returns:
+            str: The string representation, showing the source and chunk size.
+        """
+        return f'<ChunkedTable[{self.format}] {self.source} ({self.chunksize} Rows/Chunk)>'
+
+    def __iter__(self):
+        """
+        Iterates over the chunks of the source.
+
+        Yields:
+            DataTable: The next chunk of rows.
+        """
+        yield from getattr(self, f'_{self.format}_chunks')()
+
+    def _csv_chunks(self):
+        """
+        Reads the chunks of a CSV source. Column types are mapped from the first chunk holding each column.
+
+        Yields:
+            DataTable: The next chunk of rows.
+        """
+        import pandas as pd
+        _types = {}
+        for _frame in pd.read_csv(self.source, usecols=self.columns, chunksize=self.chunksize):
+            _chunk = DataTable._from_frames([_frame], types=_types)
+            _types = dict(_chunk.columns)
+            yield _chunk
+
+    def _parquet_chunks(self):
+        """
+        Reads the chunks of a Parquet source, one record batch at a time. Requires `pyarrow`, installed with the `parquet` extra.
+
+        Yields:
+            DataTable: The next chunk of rows.
+        """
+        import pyarrow.parquet as pq
+        _types = {}
+        for _batch in pq.ParquetFile(self.source).iter_batches(batch_size=self.chunksize, columns=self.columns):
+            _chunk = DataTable._from_frames([_batch.to_pandas()], types=_types)
+            _types = dict(_chunk.columns)
+            yield _chunk
+
+    def _jsonl_chunks(self):
+        """
+        Reads the chunks of a JSON Lines source. Lists of numbers become numeric arrays.
+
+        Yields:
+            DataTable: The next chunk of rows.
+        """
+        _rows = []
+        with open(self.source, 'r', encoding='utf-8') as f:
+            for _line in f:
+                if len(_line.strip()) == 0: continue
+                _row = json.loads(_line)
+                if self.columns is not None:
+                    _row = {key: val for key, val in _row.items() if key in self.columns}
+                _rows.append({key: val for key, val in _row.items() if val is not None})
+                if len(_rows) >= self.chunksize:
+                    yield DataTable(_rows)
+                    _rows = []
+        if len(_rows) > 0:
+            yield DataTable(_rows)
+
+    def _table_chunks(self):
+        """
+        Reads the chunks of a directory written by `DataTable.save`, slicing the memory-mapped columns.
+        String and other columns are read block by block, so only the blocks holding the rows of the chunk
+        are unpickled. A directory of parts written by `forward` is read part by part.
+
+        Yields:
+            DataTable: The next chunk of rows.
+        """
+        if not os.path.isfile(os.path.join(self.source, 'schema.json')):
+            for _part in sorted(os.listdir(self.source)):
+                if _part.startswith('part-'):
+                    yield from ChunkedTable(os.path.join(self.source, _part), chunksize=self.chunksize,
+                                            format='table', columns=self.columns)
+            return
+        _state = DataTable._load_state(self.source, mmap=True)
+        _names = list(_state['columns']) if self.columns is None else [name for name in _state['columns']
+                                                                        if name in self.columns]
+        for _start in range(0, _state['length'], self.chunksize):
+            _stop = min(_start + self.chunksize, _state['length'])
+            _data = OrderedDict()
+            for name in _names:
+                _payload = _state['data'][name]
+                if _payload[0] == 'numarray':
+                    _data[name] = ('numarray', _payload[1], _payload[2][_start:_stop + 1], _payload[3][_start:_stop])
+                else:
+                    _data[name] = (_payload[0],) + tuple([_part[_start:_stop] for _part in _payload[1:]])
+            yield DataTable._from_columnar({'columns': OrderedDict([(name, _state['columns'][name]) for name in _names]),
+                                            'length': _stop - _start, 'data': _data})
+
+    def forward(self, block, sink, format=None):
+        """
+        Passes every chunk through a block or workflow and appends the resulting tables to a sink.
+
+        Args:
+            block (callable): A `CalBlock`, `Workflow`, or any callable taking and returning a `DataTable`.
+            sink (str): The path of the sink.
+            format (str, optional): The sink format, one of 'csv', 'jsonl', or 'table'. Defaults to the format
+                given by the file extension, or 'table' (a directory of parts) for a path without extension.
+
+        Returns:
+            Path: The path of the sink.
+
+        Raises:
+            TypeError: If the sink format is not supported. This is checked before the sink is opened.
+            ValueError: If a chunk brings columns missing from the header of a CSV sink.
+        """
+        format = self._infer_format(sink) if format is None else format
+        if format not in ('table', 'jsonl', 'csv'):
+            raise TypeError(f'{format} Not Supported!')
+        if format == 'table':
+            os.makedirs(sink, exist_ok=True)
+            for _part in os.listdir(sink):  # Stale parts of an earlier run would be read back as results
+                if _part.startswith('part-'):
+                    shutil.rmtree(os.path.join(sink, _part))
+            for _number, _chunk in enumerate(self):
+                block(_chunk).save(os.path.join(sink, f'part-{_number:05d}'))
+            return pathlib.Path(sink)
+        with open(sink, 'w', encoding='utf-8', newline='') as f:
+            _writer = None
+            for _chunk in self:
+                _result = block(_chunk)
+                if format == 'jsonl':
+                    for line in _result._table:
+                        f.write(json.dumps({key: self._plain(cell.value) for key, cell in line.items()},
+                                           allow_nan=False) + '\n')
+                elif format == 'csv':
+                    if _writer is None:
+                        _writer = csv.DictWriter(f, fieldnames=list(_result.columns))
+                        _writer.writeheader()
+                    _new = [key for key in _result.columns if key not in _writer.fieldnames]
+                    if len(_new) > 0:
+                        raise ValueError(f'Columns {_new} are not in the CSV header {_writer.fieldnames}, '
+                                         f'which is taken from the first chunk.')
+                    for line in _result._table:
+                        _writer.writerow({key: self._text(cell.value) for key, cell in line.items()})
+        return pathlib.Path(sink)
+
+    @staticmethod
+    def _plain(value):
+        """
+        Converts a cell value to a JSON-compatible value. NaN is converted to None, as JSON has no NaN.
+
+        Args:
+            value: The cell value.
+
+        Returns:
+            The JSON-compatible value.
+        """
+        if isinstance(value, np.ndarray):
+            return [None if isinstance(_val, float) and math.isnan(_val) else _val for _val in value.tolist()]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+        if isinstance(value, BlobHandle):
+            value = value.read()
+        if isinstance(value, bytes):
+            return value.decode('utf-8', errors='replace')
+        return value
+
+    @classmethod
+    def _text(cls, value):
+        """
+        Converts a cell value to a CSV field. Numeric arrays are written space separated.
+
+        Args:
+            value: The cell value.
+
+        Returns:
+            The CSV field.
+        """
+        value = cls._plain(value)
+        if isinstance(value, list):
+            return ' '.join([str(_val) for _val in value])
+        return value
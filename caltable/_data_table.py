@@ -5,10 +5,16 @@ The DataTable module provides a structure for handling tables of data. It suppor
 
 Classes:
 - DataTable: A container for tabular data with support for adding, accessing, and manipulating rows and columns. It also supports exporting and reporting.
+- _RowView: The rows of a table view, shared with the parent table and copied on write.
+- _ColumnarRows: The rows of a table opened from columns, built when they are first read.
+- _PickleBlocks: A column stored as pickled blocks of rows, unpickled block by block.
 
 Methods:
 - __init__: Initializes a DataTable from a DataFrame or a list.
 - _infer_type: Infers the data type for each column in the table.
+- read_csv: Loads a whole CSV file as a table, in chunks.
+- read_excel: Loads a whole Excel sheet as a table, in chunks.
+- from_directory: Builds a table of the files in a directory, scanned and read in parallel.
 - __len__: Returns the number of rows in the table.
 - _preview_table: Previews the table data in a list format.
 - __repr__: Returns a string representation of the table.
@@ -16,21 +22,298 @@ Methods:
 - set_type: Sets the type for a specific column.
 - set_types: Sets types for multiple columns.
 - __setitem__: Allows setting values in the table using indexing.
-- __getitem__: Allows accessing values in the table using indexing.
+- __getitem__: Allows accessing values in the table using indexing. Row slices and masks give table views.
+- column_array: Returns a column as one NumPy array for vectorized operations.
+- set_column: Sets a whole column from an array.
+- to_bytes / from_bytes: Serializes the table column by column, with typed buffers for numeric columns.
+- save / load: Stores the table as a directory of NumPy files plus a schema, opened lazily from memory maps.
 - export: Exports the table data to a zip archive of files.
 - report: Generates a report in the form of a document.
+- report_to: Writes a Markdown report row by row, optionally as a directory of pages.
 """
 
-import pandas as pd
 import tempfile
 import os
 import shutil
 import re
+import fnmatch
+import pathlib
+import json
+import pickle
+import numpy as np
 from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from easyaccess.parameter import Parameter, meta_types
 
-import docflow as doc
 from ._data_unit import DataUnit
+from .type_engine import FileHandle
+from .type_engine import NumberTypeEngine, NumArrayTypeEngine, StringTypeEngine
+
+
+class _RowView(Sequence):
+    """
+    The rows of a table view. Rows are read from the parent rows, and a row is copied into the view
+    the first time it is modified, so the parent is never changed through the view.
+
+    Attributes:
+        rows (Sequence): The parent rows.
+        indices (Sequence): The parent index of each row of the view.
+    """
+
+    def __init__(self, rows, indices):
+        """
+        Initializes a _RowView instance.
+
+        Args:
+            rows (Sequence): The parent rows.
+            indices (Sequence): The parent index of each row of the view.
+        """
+        self.rows = rows
+        self.indices = indices
+        self._own = {}
+
+    def __len__(self):
+        """
+        Returns the number of rows in the view.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        """
+        Gets a row of the view, or a list of rows for a slice.
+
+        Args:
+            index (int or slice): The row index or slice.
+
+        Returns:
+            dict or list: The row, or the list of rows.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0: index += len(self)
+        _row = self._own.get(index)
+        return self.rows[self.indices[index]] if _row is None else _row
+
+    def writable(self, index):
+        """
+        Gets a row of the view that can be modified, copying it from the parent on first use.
+
+        Args:
+            index (int): The row index.
+
+        Returns:
+            dict: The row owned by the view.
+        """
+        if index < 0: index += len(self)
+        if index not in self._own:
+            self._own[index] = dict(self.rows[self.indices[index]])
+        return self._own[index]
+
+    def append(self, row):
+        """
+        Views have a fixed set of rows.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError('Rows cannot be appended to a table view.')
+
+
+class _ColumnarRows(Sequence):
+    """
+    The rows of a table opened from its columnar state. A row is built from the columns the first time it
+    is read and then kept, so memory-mapped and block-stored columns are only read for the rows that are
+    touched. Appended rows are kept after the stored rows.
+
+    Attributes:
+        columns (OrderedDict): The column Parameters of the table.
+        data (OrderedDict): The packed payload of each column.
+        length (int): The number of stored rows.
+    """
+
+    def __init__(self, columns, state):
+        """
+        Initializes a _ColumnarRows instance.
+
+        Args:
+            columns (OrderedDict): The column Parameters of the table.
+            state (dict): The columnar state, as built by `DataTable._columnar_state` or read by `DataTable._load_state`.
+        """
+        self.columns = columns
+        self.data = state['data']
+        self.length = state['length']
+        self._rows = {}
+        self._appended = []
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of stored and appended rows.
+        """
+        return self.length + len(self._appended)
+
+    def __getitem__(self, index):
+        """
+        Gets a row, building it on first access, or a list of rows for a slice.
+
+        Args:
+            index (int or slice): The row index or slice.
+
+        Returns:
+            dict or list: The row, or the list of rows.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0: index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Row index out of range.')
+        if index >= self.length:
+            return self._appended[index - self.length]
+        _row = self._rows.get(index)
+        if _row is None:
+            _row = self._rows.setdefault(index, self._build(index))
+        return _row
+
+    def _build(self, row):
+        """
+        Builds the cells of a stored row.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            dict: The row, mapping column names to DataUnits.
+        """
+        _line = {}
+        for name, _payload in self.data.items():
+            _param = self.columns[name]
+            if _payload[0] == 'number':
+                if _payload[2][row]: _line[name] = DataUnit(value=_payload[1][row].item(), parameter=_param)
+            elif _payload[0] == 'numarray':
+                _offsets = _payload[2]
+                if _payload[3][row]:
+                    _line[name] = DataUnit(value=_payload[1][_offsets[row]:_offsets[row + 1]], parameter=_param)
+            elif _payload[0] == 'string':
+                if _payload[2][row]: _line[name] = DataUnit(value=_payload[1][row], parameter=_param)
+            else:
+                _cell = _payload[1][row]
+                if _cell is not None: _line[name] = _cell
+        return _line
+
+    def append(self, row):
+        """
+        Appends a row after the stored rows.
+
+        Args:
+            row (dict): The row, mapping column names to DataUnits.
+        """
+        self._appended.append(row)
+
+
+class _PickleBlocks(Sequence):
+    """
+    The values of a column stored by `DataTable.save` as consecutive pickled blocks of rows. A block is only
+    unpickled when one of its rows is read, and the last block read is kept for the following rows.
+
+    Attributes:
+        path (str): The path of the block file.
+        offsets (numpy.ndarray): The byte offset of each block, followed by the file size.
+        block_rows (int): The number of rows per block.
+        length (int): The number of rows.
+    """
+
+    def __init__(self, path, offsets, block_rows, length):
+        """
+        Initializes a _PickleBlocks instance.
+
+        Args:
+            path (str): The path of the block file.
+            offsets (numpy.ndarray): The byte offset of each block, followed by the file size.
+            block_rows (int): The number of rows per block.
+            length (int): The number of rows.
+        """
+        self.path = str(path)
+        self.offsets = offsets
+        self.block_rows = block_rows
+        self.length = length
+        self._last = (None, None)
+
+    @staticmethod
+    def write(path, values, block_rows):
+        """
+        Writes values as consecutive pickled blocks of rows.
+
+        Args:
+            path (str): The path of the block file.
+            values (list): The values.
+            block_rows (int): The number of rows per block.
+
+        Returns:
+            numpy.ndarray: The byte offset of each block, followed by the file size.
+        """
+        _offsets = [0]
+        with open(path, 'wb') as f:
+            for _start in range(0, len(values), block_rows):
+                f.write(pickle.dumps(values[_start:_start + block_rows], protocol=5))
+                _offsets.append(f.tell())
+        return np.array(_offsets, dtype=np.int64)
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return self.length
+
+    def _block(self, number):
+        """
+        Reads a block, unless it is the last block read.
+
+        Args:
+            number (int): The block number.
+
+        Returns:
+            list: The values of the block.
+        """
+        _number, _values = self._last
+        if _number != number:
+            _start, _stop = int(self.offsets[number]), int(self.offsets[number + 1])
+            with open(self.path, 'rb') as f:
+                f.seek(_start)
+                _values = pickle.loads(f.read(_stop - _start))
+            self._last = (number, _values)
+        return _values
+
+    def __getitem__(self, index):
+        """
+        Gets the value of a row, or a list of values for a slice. Only the blocks holding those rows are read.
+
+        Args:
+            index (int or slice): The row index or slice.
+
+        Returns:
+            any or list: The value, or the list of values.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(self.length)[index]]
+        if index < 0: index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError('Row index out of range.')
+        return self._block(index // self.block_rows)[index % self.block_rows]
 
 
 class DataTable(object):
@@ -40,9 +323,13 @@ class DataTable(object):
 
     Attributes:
         columns (OrderedDict): A dictionary that holds the column names and their associated Parameter objects.
-        _table (list): The internal representation of the table, either as a list of rows or a DataFrame.
+        _table (list): The internal representation of the table, either as a list of rows, a `_ColumnarRows` for a
+            table opened from columns, or, for a view, a `_RowView`.
         
     Methods:
+        read_csv: Loads a whole CSV file as a table.
+        read_excel: Loads a whole Excel sheet as a table.
+        from_directory: Builds a table of the files in a directory.
         __len__: Returns the number of rows in the table.
         __repr__: Returns a string representation of the DataTable.
         _repr_html_: Returns the HTML representation of the DataTable.
@@ -50,8 +337,15 @@ class DataTable(object):
         set_types: Sets types for multiple columns.
         __setitem__: Sets values for a given cell in the table.
         __getitem__: Gets values for a given cell or row in the table.
+        column_array: Returns a column as one NumPy array.
+        set_column: Sets a whole column from an array.
+        to_bytes: Serializes the table column by column.
+        from_bytes: Restores a table serialized by `to_bytes`.
+        save: Stores the table as a directory of column files.
+        load: Opens a table stored by `save`.
         export: Exports the table as a zip archive of files.
         report: Generates a report of the table in document form.
+        report_to: Writes a Markdown report of the table while it is generated.
     """
 
     def __init__(self, df=None):
@@ -64,16 +358,17 @@ class DataTable(object):
         self.columns = OrderedDict()
         if df is None:
             self._table = []
-        elif isinstance(df, pd.DataFrame):
-            self._table = list(df.T.to_dict().values())
-            for row_index, row in enumerate(self._table):
-                for col_index, val in row.items(): self[row_index, col_index] = val
         elif isinstance(df, list):
             self._table = df
             for row_index, row in enumerate(self._table):
                 for col_index, val in row.items(): self[row_index, col_index] = val
         else:
-            raise TypeError("Input must be a DataFrame or a list.")
+            import pandas as pd
+            if not isinstance(df, pd.DataFrame):
+                raise TypeError("Input must be a DataFrame or a list.")
+            self._table = list(df.T.to_dict().values())
+            for row_index, row in enumerate(self._table):
+                for col_index, val in row.items(): self[row_index, col_index] = val
         self._infer_type(self._table)
 
     def _infer_type(self, table):
@@ -86,16 +381,261 @@ class DataTable(object):
         for line in table:
             for key, val in line.items():
                 if key not in self.columns:
-                    if isinstance(val, str):
-                        self.columns[key] = Parameter(name=key, io_type=meta_types['string'])
-                    elif isinstance(val, (int, float)):
-                        self.columns[key] = Parameter(name=key, io_type=meta_types['number'])
-                    elif isinstance(val, list) and all([isinstance(i, (int, float)) for i in val]):
-                        self.columns[key] = Parameter(name=key, io_type=meta_types['numarray'])
-                    else:
-                        self.columns[key] = Parameter(name=key, io_type=meta_types['string'])
+                    self.columns[key] = self._infer_param(key, val)
                     line[key] = DataUnit(value=val, parameter=self.columns[key])
 
+    @staticmethod
+    def _infer_param(key, val):
+        """
+        Infers the Parameter of a column from one of its values.
+
+        Args:
+            key (str): The column name.
+            val (any): A value of the column.
+
+        Returns:
+            Parameter: The Parameter object with the inferred type.
+        """
+        if isinstance(val, str):
+            return Parameter(name=key, io_type=meta_types['string'])
+        elif isinstance(val, (int, float)):
+            return Parameter(name=key, io_type=meta_types['number'])
+        elif isinstance(val, list) and all([isinstance(i, (int, float)) for i in val]):
+            return Parameter(name=key, io_type=meta_types['numarray'])
+        elif isinstance(val, np.ndarray) and val.dtype.kind in 'biuf':
+            return Parameter(name=key, io_type=meta_types['numarray'])
+        else:
+            return Parameter(name=key, io_type=meta_types['string'])
+
+    @staticmethod
+    def _infer_dtype_param(key, dtype):
+        """
+        Infers the Parameter of a column from its pandas dtype.
+
+        Args:
+            key (str): The column name.
+            dtype: The pandas dtype of the column.
+
+        Returns:
+            Parameter: The Parameter object with the inferred type.
+        """
+        if getattr(dtype, 'kind', 'O') in 'biuf':
+            return Parameter(name=key, io_type=meta_types['number'])
+        return Parameter(name=key, io_type=meta_types['string'])
+
+    def _append_row(self, row):
+        """
+        Appends a row of values whose column types are already set.
+
+        Args:
+            row (dict): A dictionary mapping column names to values.
+        """
+        self._table.append({key: DataUnit(value=val, parameter=self.columns[key]) for key, val in row.items()})
+
+    @classmethod
+    def _from_frames(cls, frames, types=None):
+        """
+        Builds a table from a sequence of DataFrame chunks. The type of each column is mapped from the first chunk
+        holding a value of it, so columns that are empty in the first chunks are not fixed early, and a number column
+        is widened to a string column when a later chunk holds text. Null cells of string columns are left empty.
+
+        Args:
+            frames (iterable): The DataFrame chunks.
+            types (dict, optional): Known column Parameters, used instead of mapping the dtypes of those columns.
+
+        Returns:
+            DataTable: The table holding the rows of all chunks.
+        """
+        _table = cls()
+        _table.set_types(types or {})
+        _strings = {key for key, param in _table.columns.items() if param.iotype.meta == 'string'}
+        for _frame in frames:
+            _keys = [str(key) for key in _frame.columns]
+            _nulls = _frame.isna().to_numpy()
+            for i, (key, dtype) in enumerate(zip(_keys, _frame.dtypes)):
+                if _nulls[:, i].all(): continue  # A column without values does not tell its type
+                _param = cls._infer_dtype_param(key, dtype)
+                if key not in _table.columns:
+                    _table.set_type(key, _param)
+                elif _param.iotype.meta == 'string' and _table.columns[key].iotype.meta == 'number':
+                    _table._widen_to_string(key)
+                if _table.columns[key].iotype.meta == 'string': _strings.add(key)
+            _rows = zip(*[_frame.iloc[:, i].tolist() for i in range(len(_keys))])  # Python scalars, not NumPy ones
+            for _values, _null in zip(_rows, _nulls):
+                _table._append_row({key: str(val) if key in _strings and not isinstance(val, str) else val
+                                    for key, val, null in zip(_keys, _values, _null)
+                                    if not (null and (key in _strings or key not in _table.columns))})
+        return _table
+
+    def _widen_to_string(self, name):
+        """
+        Changes a number column to a string column, converting the values already loaded. Null values are dropped.
+
+        Args:
+            name (str): The column name.
+        """
+        self.set_type(name, Parameter(name=name, io_type=meta_types['string']))
+        for row in range(len(self._table)):
+            _cell = self._table[row].get(name)
+            if _cell is None: continue
+            _line = self._writable(row)
+            if _cell.value is None or (isinstance(_cell.value, float) and np.isnan(_cell.value)):
+                del _line[name]
+            else:
+                _line[name] = DataUnit(value=str(_cell.value), parameter=self.columns[name])
+
+    @classmethod
+    def read_csv(cls, path, columns=None, chunksize=100000, **kwargs):
+        """
+        Loads a whole CSV file as a table. The file is parsed in chunks, so only one chunk of
+        pandas data is held at a time.
+
+        Args:
+            path (str): The path to the CSV file.
+            columns (list, optional): The columns to load. Other columns are not parsed. Defaults to all columns.
+            chunksize (int, optional): The number of rows parsed at a time. Defaults to 100000.
+            **kwargs: Additional keyword arguments for `pandas.read_csv`.
+
+        Returns:
+            DataTable: The loaded table.
+        """
+        import pandas as pd
+        return cls._from_frames(pd.read_csv(path, usecols=columns, chunksize=chunksize, **kwargs))
+
+    @classmethod
+    def read_excel(cls, path, columns=None, chunksize=100000, sheet_name=0):
+        """
+        Loads a whole Excel sheet as a table. The sheet is streamed in chunks of rows, so only one
+        chunk of pandas data is held at a time. The first row holds the column names.
+
+        Args:
+            path (str): The path to the Excel file (.xlsx).
+            columns (list, optional): The columns to load. Other columns are not converted. Defaults to all columns.
+            chunksize (int, optional): The number of rows converted at a time. Defaults to 100000.
+            sheet_name (str or int, optional): The name or position of the sheet. Defaults to the first sheet.
+
+        Returns:
+            DataTable: The loaded table.
+
+        Requires `openpyxl`, installed with the `excel` extra.
+        """
+        return cls._from_frames(cls._excel_frames(path, columns=columns, chunksize=chunksize, sheet_name=sheet_name))
+
+    @staticmethod
+    def _excel_frames(path, columns=None, chunksize=100000, sheet_name=0):
+        """
+        Streams an Excel sheet as DataFrame chunks.
+
+        Args:
+            path (str): The path to the Excel file (.xlsx).
+            columns (list, optional): The columns to keep. Defaults to all columns.
+            chunksize (int, optional): The number of rows per chunk. Defaults to 100000.
+            sheet_name (str or int, optional): The name or position of the sheet. Defaults to the first sheet.
+
+        Yields:
+            pd.DataFrame: The chunks of the sheet.
+        """
+        import pandas as pd
+        from openpyxl import load_workbook
+        _workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            _sheet = _workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else _workbook[sheet_name]
+            _rows = _sheet.iter_rows(values_only=True)
+            _header = [str(key) for key in next(_rows, ())]
+            _keep = [i for i, key in enumerate(_header) if columns is None or key in columns]
+            _chunk = []
+            for _row in _rows:
+                _chunk.append([_row[i] if i < len(_row) else None for i in _keep])
+                if len(_chunk) >= chunksize:
+                    yield pd.DataFrame(_chunk, columns=[_header[i] for i in _keep]).infer_objects()
+                    _chunk = []
+            if len(_chunk) > 0 or len(_keep) > 0:
+                yield pd.DataFrame(_chunk, columns=[_header[i] for i in _keep]).infer_objects()
+        finally:
+            _workbook.close()
+
+    @staticmethod
+    def _scan_directory(root, pattern='*', recursive=False, workers=8):
+        """
+        Lists the files of a directory matching a pattern, scanning subdirectories in parallel.
+
+        Args:
+            root (str): The directory to scan.
+            pattern (str, optional): The shell-style pattern the file names must match. Defaults to all files.
+            recursive (bool, optional): If True, subdirectories are scanned too. Defaults to False.
+            workers (int, optional): The number of directories scanned at a time. Defaults to 8.
+
+        Returns:
+            list: The `(path, size, mtime)` of each matching file, sorted by path.
+        """
+        def _scan(directory):
+            _files, _dirs = [], []
+            with os.scandir(directory) as _entries:
+                for _entry in _entries:
+                    if _entry.is_dir(follow_symlinks=False):
+                        _dirs.append(_entry.path)
+                    elif _entry.is_file() and fnmatch.fnmatch(_entry.name, pattern):
+                        _stat = _entry.stat()
+                        _files.append((_entry.path, _stat.st_size, _stat.st_mtime))
+            return _files, _dirs
+
+        _found = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            _pending = {executor.submit(_scan, root)}
+            while len(_pending) > 0:
+                _done, _pending = wait(_pending, return_when=FIRST_COMPLETED)
+                for _future in _done:
+                    _files, _dirs = _future.result()
+                    _found.extend(_files)
+                    if recursive:
+                        _pending |= {executor.submit(_scan, _dir) for _dir in _dirs}
+        return sorted(_found)
+
+    @classmethod
+    def from_directory(cls, root='./', pattern='*', recursive=False, read=False,
+                       binary=False, encoding=None, workers=8):
+        """
+        Builds a table with one row per file in a directory, holding its `path`, `filename` (without extension),
+        `size` in bytes, and `mtime`, collected in one scan. Directories are scanned and files are read
+        by a bounded pool of threads.
+
+        Args:
+            root (str, optional): The directory to scan. Defaults to the current directory.
+            pattern (str, optional): The shell-style pattern the file names must match, such as '*.pdb'. Defaults to all files.
+            recursive (bool, optional): If True, subdirectories are scanned too. Defaults to False.
+            read (bool or str, optional): If True, the file contents are read into a `file` column. If 'lazy',
+                the `file` column holds a `FileHandle` read on use. Defaults to False, which adds no `file` column.
+            binary (bool, optional): If True, files are read as bytes. Defaults to False.
+            encoding (str, optional): The encoding of text files. Defaults to the system default.
+            workers (int, optional): The number of threads scanning directories and reading files. Defaults to 8.
+
+        Returns:
+            DataTable: The table of the files, sorted by path.
+        """
+        _files = cls._scan_directory(root, pattern=pattern, recursive=recursive, workers=workers)
+        _table = cls()
+        _table.set_types({'path': Parameter.string('path', 'The path to the file'),
+                          'filename': Parameter.string('filename', 'The file name'),
+                          'size': Parameter(name='size', io_type=meta_types['number']),
+                          'mtime': Parameter(name='mtime', io_type=meta_types['number'])})
+        if read == 'lazy':
+            _contents = [FileHandle(path, binary=binary, encoding=encoding) for path, _, _ in _files]
+        elif read:
+            def _read(path):
+                with open(path, 'rb' if binary else 'r', encoding=encoding) as f:
+                    return f.read()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                _contents = list(executor.map(_read, [path for path, _, _ in _files]))
+        else:
+            _contents = None
+        if _contents is not None:
+            _table.set_type('file', Parameter.string('file', 'The file data'))
+        for row, (path, size, mtime) in enumerate(_files):
+            _row = dict(path=path, filename=pathlib.Path(path).stem, size=size, mtime=mtime)
+            if _contents is not None: _row['file'] = _contents[row]
+            _table._append_row(_row)
+        return _table
+
     def __len__(self):
         """
         Returns the number of rows in the table.
@@ -134,6 +674,7 @@ class DataTable(object):
         Returns:
             str: A string representation of the DataTable.
         """
+        import pandas as pd
         _preview, _columns = self._preview_table()
         return pd.DataFrame(_preview, columns=_columns).__repr__()
 
@@ -144,6 +685,7 @@ class DataTable(object):
         Returns:
             str: The HTML representation of the DataTable.
         """
+        import pandas as pd
         _preview, _columns = self._preview_table()
         return pd.DataFrame(_preview, columns=_columns)._repr_html_()
 
@@ -178,35 +720,78 @@ class DataTable(object):
         row, col = keys[0], keys[1]
         _param = self.columns.get(col)
         if _param is None:
-            key = col
-            if isinstance(val, str):
-                self.columns[key] = Parameter(name=key, io_type=meta_types['string'])
-            elif isinstance(val, (int, float)):
-                self.columns[key] = Parameter(name=key, io_type=meta_types['number'])
-            elif isinstance(val, list) and all([isinstance(i, (int, float)) for i in val]):
-                self.columns[key] = Parameter(name=key, io_type=meta_types['numarray'])
-            else:
-                self.columns[key] = Parameter(name=key, io_type=meta_types['string'])
+            self.columns[col] = self._infer_param(col, val)
         _data = DataUnit(value=val, parameter=self.columns.get(col))
-        if isinstance(row, slice):
-            if row.start is None and row.stop is None:
-                for i in range(len(self._table)):
-                    self._table[i][col] = _data
-            else:
-                for i in range(row.start, row.stop, row.step):
-                    self._table[i][col] = _data
+        if isinstance(row, (slice, list, np.ndarray)):
+            for i in self._row_indices(row):
+                self._writable(i)[col] = _data
         else:
-            self._table[row][col] = _data
+            self._writable(row)[col] = _data
+
+    def _writable(self, row):
+        """
+        Gets a row that can be modified. The rows of a view are copied from the parent on first write.
+
+        Args:
+            row (int): The row index.
+
+        Returns:
+            dict: The row.
+        """
+        if isinstance(self._table, _RowView):
+            return self._table.writable(row)
+        return self._table[row]
+
+    def _row_indices(self, row):
+        """
+        Resolves a row slice, boolean mask, or list of row indices.
+
+        Args:
+            row (slice, list, or numpy.ndarray): The row selection.
+
+        Returns:
+            Sequence: The selected row indices.
+
+        Raises:
+            IndexError: If a boolean mask does not match the number of rows.
+        """
+        if isinstance(row, slice):
+            return range(len(self._table))[row]
+        _row = np.asarray(row)
+        if _row.dtype == bool:
+            if len(_row) != len(self._table):
+                raise IndexError(f'Boolean mask of length {len(_row)} does not match {len(self._table)} rows.')
+            return np.flatnonzero(_row).tolist()
+        return [int(i) + len(self._table) if i < 0 else int(i) for i in _row.tolist()]
+
+    def _view(self, indices):
+        """
+        Creates a table view sharing the rows of this table. Writing to the view copies the modified rows,
+        and the column types of the view are its own.
+
+        Args:
+            indices (Sequence): The row indices of the view.
+
+        Returns:
+            DataTable: The view.
+        """
+        _view = self.__class__.__new__(self.__class__)
+        _view.columns = OrderedDict(self.columns)
+        _view._table = _RowView(self._table, indices)
+        return _view
 
     def __getitem__(self, keys):
         """
         Gets a value from the table using indexing.
 
+        A row slice, boolean mask, or list of row indices without a column gives a `DataTable` view
+        sharing the rows of this table, which blocks can run on. Modified rows are copied into the view.
+
         Args:
             keys (tuple): A tuple containing the row index and column name, or just the row index.
         
         Returns:
-            any: The data corresponding to the given row and column, or the entire row.
+            any: The data corresponding to the given row and column, the entire row, or a table view.
         """
         col = None
         if isinstance(keys, tuple):
@@ -216,9 +801,12 @@ class DataTable(object):
                 row = keys[0]
         else:
             row = keys
-        _data = self._table[row]
-        if not isinstance(row, slice):
-            _data = [_data]
+        if isinstance(row, (slice, list, np.ndarray)):
+            if col is None:
+                return self._view(self._row_indices(row))
+            _data = [self._table[i] for i in self._row_indices(row)]
+        else:
+            _data = [self._table[row]]
         if col is not None:
             if isinstance(col, list):
                 _data = [{col_: line[col_] if col_ in line else None for col_ in col} for line in _data]
@@ -228,6 +816,270 @@ class DataTable(object):
             _data = _data[0]
         return _data
 
+    def column_array(self, name, fill=np.nan):
+        """
+        Returns a column as one NumPy array, so that comparisons and arithmetic over the whole column
+        evaluate in one vectorized pass. Number columns give a 1-D array, and numarray columns give a
+        2-D array with one row per table row, padded to the longest array.
+
+        Args:
+            name (str): The column name.
+            fill (optional): The value of missing cells and padding. Defaults to NaN.
+
+        Returns:
+            numpy.ndarray: The column array.
+        """
+        _values = [line[name].value if name in line else None for line in self._table]
+        _param = self.columns.get(name)
+        if _param is not None and _param.iotype.meta == 'numarray':
+            _lengths = self.column_lengths(name)
+            _array = np.full((len(_values), int(_lengths.max(initial=0))), fill, dtype=np.float64)
+            for row, val in enumerate(_values):
+                if val is not None: _array[row, :_lengths[row]] = val
+            return _array
+        return np.array([fill if val is None else val for val in _values])
+
+    def column_lengths(self, name):
+        """
+        Returns the length of each cell of a column, which is 0 for missing cells.
+
+        Args:
+            name (str): The column name.
+
+        Returns:
+            numpy.ndarray: The cell lengths.
+        """
+        return np.array([len(line[name]) if name in line else 0 for line in self._table], dtype=np.int64)
+
+    def set_column(self, name, values, lengths=None, param=None):
+        """
+        Sets a whole column from an array, such as the result of operations on `column_array`.
+        A 2-D array sets a numarray column, with each row trimmed to its length if `lengths` is given.
+
+        Args:
+            name (str): The column name.
+            values (array-like): One value per table row.
+            lengths (array-like, optional): The length of each numarray cell, to drop the padding.
+            param (Parameter, optional): The column type. Defaults to the existing type, or one inferred from `values`.
+
+        Raises:
+            ValueError: If the number of values does not match the number of rows.
+        """
+        if len(values) != len(self._table):
+            raise ValueError(f'Expected {len(self._table)} values for {name}, got {len(values)}.')
+        if param is not None:
+            self.set_type(name, param)
+        elif name not in self.columns:
+            if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+                _meta = 'numarray' if values.ndim > 1 else 'number'
+                self.set_type(name, Parameter(name=name, io_type=meta_types[_meta]))
+            else:
+                self.set_type(name, self._infer_param(name, values[0] if len(values) > 0 else None))
+        for row, val in enumerate(values):
+            if lengths is not None: val = val[:lengths[row]]
+            if isinstance(val, np.generic): val = val.item()
+            self._writable(row)[name] = DataUnit(value=val, parameter=self.columns[name])
+
+    @staticmethod
+    def _pack_column(cells):
+        """
+        Packs the cells of a column into contiguous buffers when they hold plain numbers or numeric arrays.
+        Numbers are packed as int64 when they are all ints and as float64 when they are all floats, so that
+        they come back with their type. Columns mixing both, or holding ints beyond int64, are object columns.
+
+        Args:
+            cells (list): The DataUnit of each row, or None for missing cells.
+
+        Returns:
+            tuple: `('number', values, present)` for numbers, `('numarray', flat values, offsets, present)`
+                for numeric arrays, `('string', values or handles, present)` for strings, or `('object', cells)`
+                for any other column.
+        """
+        _present = np.array([cell is not None for cell in cells], dtype=bool)
+        _engines = [cell._engine for cell in cells if cell is not None]
+        if len(_engines) > 0 and all([type(_engine) is NumberTypeEngine and _engine.handle is None
+                                      and type(_engine._value) in (int, float) for _engine in _engines]):
+            _types = {type(_engine._value) for _engine in _engines}
+            if len(_types) == 1:
+                _dtype = np.int64 if int in _types else np.float64
+                _values = [cell._engine._value if cell is not None else 0 for cell in cells]
+                try: return ('number', np.array(_values, dtype=_dtype), _present)
+                except OverflowError: pass
+        if len(_engines) > 0 and all([type(_engine) is NumArrayTypeEngine and isinstance(_engine._value, np.ndarray)
+                                      and _engine._value.ndim == 1 and _engine._value.dtype.kind in 'biuf'
+                                      for _engine in _engines]):
+            _arrays = [cell._engine._value if cell is not None else np.empty(0) for cell in cells]
+            _offsets = np.zeros(len(_arrays) + 1, dtype=np.int64)
+            np.cumsum([len(_array) for _array in _arrays], out=_offsets[1:])
+            return ('numarray', np.concatenate(_arrays), _offsets, _present)
+        if len(_engines) > 0 and all([type(_engine) is StringTypeEngine for _engine in _engines]):
+            _values = [None if cell is None else cell._engine.handle if cell._engine.handle is not None
+                       else cell._engine._value for cell in cells]
+            return ('string', _values, _present)
+        return ('object', cells)
+
+    def _columnar_state(self):
+        """
+        Collects the table as a schema of column Parameters plus one packed payload per column.
+
+        Returns:
+            dict: The columnar state.
+        """
+        _data = OrderedDict()
+        for name in self.columns:
+            _data[name] = self._pack_column([line.get(name) for line in self._table])
+        return {'columns': self.columns, 'length': len(self._table), 'data': _data}
+
+    @classmethod
+    def _from_columnar(cls, state):
+        """
+        Rebuilds a table from its columnar state. The cells of a row are built when the row is first read,
+        and numeric array cells are views of the shared buffer.
+
+        Args:
+            state (dict): The columnar state.
+
+        Returns:
+            DataTable: The rebuilt table.
+        """
+        _table = cls.__new__(cls)
+        _table.columns = OrderedDict(state['columns'])
+        _table._table = _ColumnarRows(_table.columns, state)
+        return _table
+
+    def __reduce__(self):
+        """
+        Pickles the table column by column. Numeric columns are contiguous NumPy buffers, so with pickle
+        protocol 5 and a `buffer_callback` they are transferred out of band without copies.
+
+        Returns:
+            tuple: The callable rebuilding the table and its arguments.
+        """
+        return (self.__class__._from_columnar, (self._columnar_state(),))
+
+    def to_bytes(self, buffer_callback=None):
+        """
+        Serializes the table column by column with pickle protocol 5.
+
+        Args:
+            buffer_callback (callable, optional): Receives the numeric buffers out of band instead of copying them
+                into the bytes, as `pickle.dumps` does. They must then be given to `from_bytes`.
+
+        Returns:
+            bytes: The serialized table.
+        """
+        return pickle.dumps(self, protocol=5, buffer_callback=buffer_callback)
+
+    @classmethod
+    def from_bytes(cls, data, buffers=None):
+        """
+        Restores a table serialized by `to_bytes`.
+
+        Args:
+            data (bytes): The serialized table.
+            buffers (iterable, optional): The out-of-band buffers collected by the `buffer_callback` of `to_bytes`.
+
+        Returns:
+            DataTable: The restored table.
+        """
+        return pickle.loads(data, buffers=buffers)
+
+    def save(self, path, block_rows=4096):
+        """
+        Stores the table in a directory, with the column types intact. Number and numarray columns are
+        written as `.npy` files (numarray cells as one flat array plus row offsets). String and other columns
+        are written to their own file as pickled blocks of `block_rows` rows, with the block offsets in a `.npy`
+        file. `schema.json` describes the columns, and `parameters.pkl` holds their Parameters.
+
+        Args:
+            path (str): The directory to write. It is created if needed.
+            block_rows (int, optional): The number of rows per pickled block. Defaults to 4096.
+
+        Returns:
+            Path: The directory path.
+        """
+        os.makedirs(path, exist_ok=True)
+        _state = self._columnar_state()
+        _schema = []
+        for _number, (name, _payload) in enumerate(_state['data'].items()):
+            _prefix = f'col{_number:05d}'
+            _iotype = self.columns[name].iotype
+            _schema.append({'name': name, 'kind': _payload[0], 'file': _prefix,
+                            'meta': _iotype.meta, 'iotype': _iotype.id})
+            _file = lambda part: os.path.join(path, f'{_prefix}.{part}')
+            if _payload[0] == 'number':
+                np.save(_file('values.npy'), _payload[1])
+                np.save(_file('present.npy'), _payload[2])
+            elif _payload[0] == 'numarray':
+                np.save(_file('values.npy'), _payload[1])
+                np.save(_file('offsets.npy'), _payload[2])
+                np.save(_file('present.npy'), _payload[3])
+            else:
+                np.save(_file('blocks.npy'), _PickleBlocks.write(_file('values.pkl'), _payload[1], block_rows))
+                if _payload[0] == 'string': np.save(_file('present.npy'), _payload[2])
+                _schema[-1]['block_rows'] = block_rows
+        with open(os.path.join(path, 'parameters.pkl'), 'wb') as f:
+            pickle.dump(_state['columns'], f)
+        with open(os.path.join(path, 'schema.json'), 'w', encoding='utf-8') as f:
+            json.dump({'format': 'caltable', 'version': 2, 'length': _state['length'], 'columns': _schema}, f, indent=2)
+        return pathlib.Path(path)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Opens a table stored by `save`. Cells are built when their row is first read. With `mmap`, numeric
+        files are memory-mapped and numarray cells are views of the mapped files, so only the pages that are
+        touched are read. String and other columns are read one block of rows at a time.
+
+        Args:
+            path (str): The directory written by `save`.
+            mmap (bool, optional): If True, numeric files are memory-mapped instead of read. Defaults to True.
+
+        Returns:
+            DataTable: The opened table.
+        """
+        return cls._from_columnar(cls._load_state(path, mmap=mmap))
+
+    @staticmethod
+    def _load_state(path, mmap=True):
+        """
+        Opens the columnar state of a table stored by `save`, without reading string and other columns.
+        Those columns are `_PickleBlocks` sequences.
+
+        Args:
+            path (str): The directory written by `save`.
+            mmap (bool, optional): If True, numeric files are memory-mapped instead of read. Defaults to True.
+
+        Returns:
+            dict: The columnar state.
+
+        Raises:
+            ValueError: If the directory is not in a format version this release reads.
+        """
+        _mode = 'r' if mmap else None
+        with open(os.path.join(path, 'schema.json'), 'r', encoding='utf-8') as f:
+            _schema = json.load(f)
+        if _schema.get('format') != 'caltable' or _schema.get('version') != 2:
+            raise ValueError(f'{path} is not a CalTable directory of version 2 '
+                             f'(format {_schema.get("format")!r}, version {_schema.get("version")!r}).')
+        with open(os.path.join(path, 'parameters.pkl'), 'rb') as f:
+            _columns = pickle.load(f)
+        _data = OrderedDict()
+        for _column in _schema['columns']:
+            _file = lambda part: os.path.join(path, f'{_column["file"]}.{part}')
+            if _column['kind'] == 'number':
+                _data[_column['name']] = ('number', np.load(_file('values.npy'), mmap_mode=_mode),
+                                          np.load(_file('present.npy')))
+            elif _column['kind'] == 'numarray':
+                _data[_column['name']] = ('numarray', np.load(_file('values.npy'), mmap_mode=_mode),
+                                          np.load(_file('offsets.npy')), np.load(_file('present.npy')))
+            else:
+                _values = _PickleBlocks(_file('values.pkl'), np.load(_file('blocks.npy')),
+                                        _column['block_rows'], _schema['length'])
+                _data[_column['name']] = (('string', _values, np.load(_file('present.npy')))
+                                          if _column['kind'] == 'string' else ('object', _values))
+        return {'columns': _columns, 'length': _schema['length'], 'data': _data}
+
     def export(self, path='./', file_name='package', format='zip', index_col=None):
         """
         Exports the table data to a zip archive of files.
@@ -261,34 +1113,204 @@ class DataTable(object):
             shutil.make_archive(os.path.join(path, file_name), format=format, root_dir=temp_dir)
         return _file_counts
 
-    def report(self, title=None, index_col=None):
+    @staticmethod
+    def _plotly_runtime(plotlyjs='inline'):
         """
-        Generates a report of the table data in document form.
+        Returns the script tag loading the Plotly runtime shared by all figures of a report.
 
         Args:
-            title (str, optional): The title of the report. Defaults to 'Report'.
+            plotlyjs (str, optional): 'inline' embeds the runtime, and 'cdn' loads it from the Plotly CDN. Defaults to 'inline'.
+
+        Returns:
+            str: The script tag.
+        """
+        if plotlyjs == 'cdn':
+            from plotly.offline import get_plotlyjs_version
+            return f'<script src="https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js" charset="utf-8"></script>'
+        from plotly.offline import get_plotlyjs
+        return f'<script type="text/javascript">{get_plotlyjs()}</script>'
+
+    def _render_rows(self, rows, workers=None, cache=True):
+        """
+        Renders the cells of some rows as HTML with a pool of threads. Figures are rendered as divs
+        without the Plotly runtime.
+
+        Args:
+            rows (iterable): The row indices.
+            workers (int, optional): The number of threads rendering cells. Defaults to the executor default.
+            cache (bool, optional): If False, engines do not keep the rendered HTML. Defaults to True.
+
+        Returns:
+            list: For each row, a list of `(column name, html)` pairs.
+        """
+        _cells = [(_order, cell) for _order, row in enumerate(rows) for cell in self._table[row].values()]
+        _render = lambda _index: _cells[_index][1].view_html(include_plotlyjs=False, cache=cache)
+        _htmls, _engines = [None] * len(_cells), set()
+        for _index, (_, cell) in enumerate(_cells):  # Render one cell of each engine first, so lazy imports run once
+            if type(cell._engine) not in _engines:
+                _engines.add(type(cell._engine))
+                _htmls[_index] = _render(_index)
+        _pending = [_index for _index, _html in enumerate(_htmls) if _html is None]
+        if len(_pending) > 0:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _index, _html in zip(_pending, executor.map(_render, _pending)):
+                    _htmls[_index] = _html
+        _rendered = [[] for _ in rows]
+        for (_order, cell), _html in zip(_cells, _htmls):
+            _rendered[_order].append((cell.name, _html))
+        return _rendered
+
+    def _report_row(self, row, rendered, index_col=None):
+        """
+        Builds the report section of a row from its rendered cells.
+
+        Args:
+            row (int): The row index.
+            rendered (list): The `(column name, html)` pairs of the row.
             index_col (str, optional): The column to use as the index in the report. Defaults to None.
 
         Returns:
-            doc.Document: The generated document report.
+            doc.Expander: The report section of the row.
         """
-        doc_blocks = []
-        for row in range(len(self)):
-            _index = str(self[row, index_col].preview if index_col is not None else row)
-            doc_blocks_row = []
-            doc_blocks_row.append(doc.Title(_index, level=3))
-            for cell in self[row].values():
-                _doc_unit = doc.Document(
-                    doc.Title(cell.name, level=4),
-                    doc.Text(cell.view_html()),
-                    doc.Text('\n\n'),
-                )
-                doc_blocks_row.append(_doc_unit)
-            doc_blocks.append(doc.Expander(doc.Document(*doc_blocks_row), _index))
-        return doc.Document(
+        import docflow as doc
+        _index = str(self[row, index_col].preview if index_col is not None else row)
+        doc_blocks_row = []
+        doc_blocks_row.append(doc.Title(_index, level=3))
+        for name, _html in rendered:
+            _doc_unit = doc.Document(
+                doc.Title(name, level=4),
+                doc.Text(_html),
+                doc.Text('\n\n'),
+            )
+            doc_blocks_row.append(_doc_unit)
+        return doc.Expander(doc.Document(*doc_blocks_row), _index)
+
+    @staticmethod
+    def _report_header(title=None):
+        """
+        Builds the title and stamps of a report.
+
+        Args:
+            title (str, optional): The title of the report. Defaults to 'Report'.
+
+        Returns:
+            list: The header blocks.
+        """
+        import docflow as doc
+        return [
             doc.Title('Report' if title is None else title, level=1),
             doc.IdenticalBadge(),
             doc.UUIDStamp(),
             doc.DateTimeStamp(timefmt='%d-%m-%Y %H:%M:%S'),
+        ]
+
+    def report(self, title=None, index_col=None, workers=None, plotlyjs='inline'):
+        """
+        Generates a report of the table data in document form.
+
+        The cells are rendered by a pool of threads. Figures are rendered as lightweight divs, and the
+        Plotly runtime they need is included once at the top of the report.
+
+        Args:
+            title (str, optional): The title of the report. Defaults to 'Report'.
+            index_col (str, optional): The column to use as the index in the report. Defaults to None.
+            workers (int, optional): The number of threads rendering cells. Defaults to the executor default.
+            plotlyjs (str, optional): 'inline' embeds the Plotly runtime, and 'cdn' loads it from the Plotly CDN.
+                Defaults to 'inline'.
+
+        Returns:
+            doc.Document: The generated document report.
+        """
+        import docflow as doc
+        _rendered = self._render_rows(range(len(self)), workers=workers)
+        doc_blocks = [self._report_row(row, _cells, index_col=index_col) for row, _cells in enumerate(_rendered)]
+        _runtime = []
+        if any(['Plotly.newPlot' in str(_html) for _cells in _rendered for _, _html in _cells]):
+            _runtime.append(doc.Text(self._plotly_runtime(plotlyjs)))
+        return doc.Document(
+            *self._report_header(title),
+            *_runtime,
             *doc_blocks
         )
+
+    def report_to(self, path, title=None, index_col=None, page_size=None, workers=None, plotlyjs='inline'):
+        """
+        Writes a Markdown report of the table data while it is generated, so only one page of rows is
+        rendered and held in memory at a time.
+
+        Without `page_size`, the report is one Markdown file. With `page_size`, `path` is a directory holding
+        one Markdown file per page of rows and an `index.md` linking them. In that case an inline Plotly runtime
+        is written once to `plotly.min.js` and loaded by every page.
+
+        The Markdown embeds the rendered HTML of the cells, like `report().markdown`. An HTML report needs the
+        whole document, so use `report()` for it.
+
+        Args:
+            path (str): The Markdown file, or the directory of pages if `page_size` is given.
+            title (str, optional): The title of the report. Defaults to 'Report'.
+            index_col (str, optional): The column to use as the index in the report. Defaults to None.
+            page_size (int, optional): The number of rows per page. Defaults to a single file.
+            workers (int, optional): The number of threads rendering cells. Defaults to the executor default.
+            plotlyjs (str, optional): 'inline' embeds the Plotly runtime, and 'cdn' loads it from the Plotly CDN.
+                Defaults to 'inline'.
+
+        Returns:
+            Path: The path of the report file, or of the index page if `page_size` is given.
+        """
+        import docflow as doc
+        _chunk = page_size if page_size is not None else 100
+        _pages = [range(_start, min(_start + _chunk, len(self))) for _start in range(0, len(self), _chunk)]
+        if page_size is None:
+            _runtime = lambda: self._plotly_runtime(plotlyjs)
+            with open(path, 'w', encoding='utf-8') as f:
+                self._write_report_rows(f, _pages, doc.Document(*self._report_header(title)).markdown,
+                                        _runtime, index_col=index_col, workers=workers)
+            return pathlib.Path(path)
+        os.makedirs(path, exist_ok=True)
+        if plotlyjs == 'cdn':
+            _runtime = lambda: self._plotly_runtime('cdn')
+        else:
+            _runtime = lambda: '<script src="plotly.min.js" charset="utf-8"></script>'
+        _links, _runtime_written = {}, False
+        for _number, _rows in enumerate(_pages, 1):
+            _name = f'page-{_number:05d}.md'
+            _header = doc.Document(doc.Title(f'{"Report" if title is None else title} ({_number}/{len(_pages)})', level=1),
+                                   doc.Text('[Index](index.md)\n\n')).markdown
+            with open(os.path.join(path, _name), 'w', encoding='utf-8') as f:
+                _plots = self._write_report_rows(f, [_rows], _header, _runtime, index_col=index_col, workers=workers)
+            if _plots and plotlyjs != 'cdn' and not _runtime_written:
+                from plotly.offline import get_plotlyjs
+                with open(os.path.join(path, 'plotly.min.js'), 'w', encoding='utf-8') as f:
+                    f.write(get_plotlyjs())
+                _runtime_written = True
+            _links[f'Rows {_rows.start} - {_rows.stop - 1}'] = f'[{_name}]({_name})'
+        _index = os.path.join(path, 'index.md')
+        with open(_index, 'w', encoding='utf-8') as f:
+            f.write(doc.Document(*self._report_header(title), doc.Sequence(_links)).markdown)
+        return pathlib.Path(_index)
+
+    def _write_report_rows(self, file, pages, header, runtime, index_col=None, workers=None):
+        """
+        Renders and writes the rows of a report file, one chunk of rows at a time. The Plotly runtime
+        is written before the first figure.
+
+        Args:
+            file: The open file to write to.
+            pages (list): The chunks of row indices.
+            header (str): The Markdown written at the top of the file.
+            runtime (callable): Returns the script tag loading the Plotly runtime.
+            index_col (str, optional): The column to use as the index in the report. Defaults to None.
+            workers (int, optional): The number of threads rendering cells. Defaults to the executor default.
+
+        Returns:
+            bool: True if the file holds a figure.
+        """
+        file.write(header)
+        _plots = False
+        for _rows in pages:
+            for row, _cells in zip(_rows, self._render_rows(_rows, workers=workers, cache=False)):
+                if not _plots and any(['Plotly.newPlot' in str(_html) for _, _html in _cells]):
+                    file.write(runtime() + '\n\n')
+                    _plots = True
+                file.write(self._report_row(row, _cells, index_col=index_col).markdown)
+        return _plots
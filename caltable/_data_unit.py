@@ -11,12 +11,14 @@ Methods:
 - __repr__: Returns a string representation of the DataUnit.
 - __len__: Returns the length of the data managed by the engine.
 - Comparison operators (__eq__, __ne__, __lt__, etc.): Allow comparison operations between DataUnit instances or between a DataUnit and other values.
+- Arithmetic operators (__add__, __sub__, __mul__, etc.): Allow arithmetic operations between DataUnit instances or between a DataUnit and other values.
 - _repr_markdown_: Returns the markdown representation of the DataUnit.
 - view_html: Returns the HTML view of the data.
 - preview: Provides a preview of the data.
 - file: Allows exporting the data to a file.
 - register_engine: Registers a custom engine for specific iotype IDs.
 - register: A decorator function for registering engines for specific iotype IDs.
+- register_lazy: Registers an engine for specific iotype IDs without importing it.
 """
 
 from .type_engine._meta_engines import _MetaEngineLibs
@@ -37,15 +39,23 @@ class DataUnit(object):
         __repr__: Returns a string representation of the DataUnit.
         __len__: Returns the length of the data managed by the engine.
         Comparison operators (__eq__, __ne__, __lt__, etc.): Allow comparison operations on the data.
+        Arithmetic operators (__add__, __sub__, __mul__, etc.): Allow arithmetic operations on the data.
         _repr_markdown_: Returns a markdown formatted representation of the data.
         view_html: Returns the HTML view of the data.
         preview: Returns a preview of the data.
         file: Exports the data to a file.
         register_engine: Registers a custom engine for a given iotype ID.
         register: A decorator function for engine registration.
+        register_lazy: Registers an engine loader imported on first use.
+
+    A DataUnit only holds its parameter, which is shared by all cells of a column, and its engine.
+    `name`, `desc`, and `iotype` are read from the parameter.
     """
 
+    __slots__ = ('parameter', '_engine')
+
     _specific_engines = {}
+    _lazy_engines = {}
 
     def __init__(self, parameter, value):
         """
@@ -56,14 +66,51 @@ class DataUnit(object):
             value: The data value to be handled.
         """
         self.parameter = parameter
-        self.name = parameter.name
-        self.desc = parameter.desc
-        self.iotype = parameter.iotype
-        self._engine = self._build_engine(self.iotype, value)
+        self._engine = self._build_engine(parameter.iotype, value)
+
+    @property
+    def name(self):
+        """
+        The name of the parameter.
+
+        Returns:
+            str: The parameter name.
+        """
+        return self.parameter.name
+
+    @property
+    def desc(self):
+        """
+        The description of the parameter.
+
+        Returns:
+            str: The parameter description.
+        """
+        return self.parameter.desc
+
+    @property
+    def iotype(self):
+        """
+        The input/output type of the parameter.
+
+        Returns:
+            IOType: The parameter type.
+        """
+        return self.parameter.iotype
     
     @property
     def value(self):
         return self._engine.value
+
+    @property
+    def handle(self):
+        """
+        The handle of a value kept on disk, or None if the value is in memory.
+
+        Returns:
+            BlobHandle or None: The handle of the value.
+        """
+        return self._engine.handle
     
     @classmethod
     def _build_engine(cls, iotype, value):
@@ -77,6 +124,8 @@ class DataUnit(object):
         Returns:
             An engine that will handle operations for this data.
         """
+        if iotype.id in cls._lazy_engines:
+            cls._load_engine(iotype.id)
         if iotype.id in cls._specific_engines:
             return cls._specific_engines[iotype.id](value=value, iotype=iotype)
         return _MetaEngineLibs.build(value=value, iotype=iotype)
@@ -199,6 +248,192 @@ class DataUnit(object):
         """
         return self._binary_opt(other, self._engine.__contains__)
 
+    def __add__(self, other):
+        """
+        Adds the data and another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the sum.
+        """
+        return self._binary_opt(other, self._engine.__add__)
+
+    def __radd__(self, other):
+        """
+        Adds another value and the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the sum.
+        """
+        return self._binary_opt(other, self._engine.__radd__)
+
+    def __sub__(self, other):
+        """
+        Subtracts another value or DataUnit from the data.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the difference.
+        """
+        return self._binary_opt(other, self._engine.__sub__)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the data from another value.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the difference.
+        """
+        return self._binary_opt(other, self._engine.__rsub__)
+
+    def __mul__(self, other):
+        """
+        Multiplies the data and another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the product.
+        """
+        return self._binary_opt(other, self._engine.__mul__)
+
+    def __rmul__(self, other):
+        """
+        Multiplies another value and the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the product.
+        """
+        return self._binary_opt(other, self._engine.__rmul__)
+
+    def __truediv__(self, other):
+        """
+        Divides the data by another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the quotient.
+        """
+        return self._binary_opt(other, self._engine.__truediv__)
+
+    def __rtruediv__(self, other):
+        """
+        Divides another value by the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the quotient.
+        """
+        return self._binary_opt(other, self._engine.__rtruediv__)
+
+    def __floordiv__(self, other):
+        """
+        Floor-divides the data by another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the floor quotient.
+        """
+        return self._binary_opt(other, self._engine.__floordiv__)
+
+    def __rfloordiv__(self, other):
+        """
+        Floor-divides another value by the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the floor quotient.
+        """
+        return self._binary_opt(other, self._engine.__rfloordiv__)
+
+    def __mod__(self, other):
+        """
+        Takes the remainder of dividing the data by another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the remainder.
+        """
+        return self._binary_opt(other, self._engine.__mod__)
+
+    def __rmod__(self, other):
+        """
+        Takes the remainder of dividing another value by the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the remainder.
+        """
+        return self._binary_opt(other, self._engine.__rmod__)
+
+    def __pow__(self, other):
+        """
+        Raises the data to the power of another value or DataUnit.
+        
+        Args:
+            other: The other value or DataUnit to operate on.
+        
+        Returns:
+            The result, the power.
+        """
+        return self._binary_opt(other, self._engine.__pow__)
+
+    def __rpow__(self, other):
+        """
+        Raises another value to the power of the data.
+        
+        Args:
+            other: The other value to operate on.
+        
+        Returns:
+            The result, the power.
+        """
+        return self._binary_opt(other, self._engine.__rpow__)
+
+    def __neg__(self):
+        """
+        Negates the data.
+        
+        Returns:
+            The negated data.
+        """
+        return -self._engine
+
+    def __abs__(self):
+        """
+        Takes the absolute value of the data.
+        
+        Returns:
+            The absolute value of the data.
+        """
+        return abs(self._engine)
+
     def _repr_markdown_(self):
         """
         Returns the markdown formatted representation of the DataUnit.
@@ -230,17 +465,18 @@ class DataUnit(object):
         """
         return self._engine.preview
 
-    def file(self, name=None):
+    def file(self, name=None, **kwargs):
         """
         Exports the data to a file.
         
         Args:
             name: The name of the file to save. If None, the default name is used.
+            kwargs: Additional arguments for the engine, such as the file extension `ext`.
         
         Returns:
             FileUnit: The FileUnit object representing the saved file.
         """
-        return self._engine.file(name=self.name if name is None else name)
+        return self._engine.file(name=self.name if name is None else name, **kwargs)
 
     @classmethod
     def register_engine(cls, iotype_ids, engine):
@@ -252,10 +488,40 @@ class DataUnit(object):
             engine: The engine to register.
         """
         if isinstance(iotype_ids, str):
-            cls._specific_engines[iotype_ids] = engine
-        else:
-            for iotype_id in iotype_ids:
-                cls._specific_engines[iotype_id] = engine
+            iotype_ids = [iotype_ids]
+        for iotype_id in iotype_ids:
+            cls._lazy_engines.pop(iotype_id, None)
+            cls._specific_engines[iotype_id] = engine
+
+    @classmethod
+    def register_lazy(cls, iotype_ids, loader):
+        """
+        Registers an engine for specific iotype IDs without importing it.
+        The engine is loaded the first time data of one of these iotypes is built.
+        
+        Args:
+            iotype_ids: The iotype IDs to register the engine for.
+            loader: An object whose `load()` returns the engine, such as an entry point.
+        """
+        if isinstance(iotype_ids, str):
+            iotype_ids = [iotype_ids]
+        for iotype_id in iotype_ids:
+            cls._lazy_engines[iotype_id] = loader
+
+    @classmethod
+    def _load_engine(cls, iotype_id):
+        """
+        Loads a lazily registered engine and registers it.
+        
+        Args:
+            iotype_id: The iotype ID of the engine.
+        """
+        _loader = cls._lazy_engines.get(iotype_id)
+        if _loader is not None:
+            _engine = _loader.load()  # The registration is kept if loading fails
+            cls._lazy_engines.pop(iotype_id, None)
+            if iotype_id not in cls._specific_engines:
+                cls.register_engine(iotype_id, _engine)
 
     @classmethod
     def register(cls, iotype_ids):
@@ -18,9 +18,12 @@ Modules:
 
 from .calblock._lib import CalBlockLib
 from .calblock._lib import RemoteCalBlockLib
-import docflow as doc
+from .calblock import CalBlockBalanced
 from . import LocalCal
+import threading
+import warnings
 import json
+import time
 import os
 
 
@@ -32,9 +35,13 @@ class CalLibIndex(object):
     -----------
     _libs : list
         A list containing instances of `CalBlockLib` and `LocalCal` libraries.
+    _index : dict
+        A dictionary mapping algorithm names to ordered lists of `(source, library)` pairs.
+    _unavailable : list
+        The configurations of remote hosts that could not be connected.
     """
 
-    def __init__(self, *args, config=None, local=True):
+    def __init__(self, *args, config=None, local=True, timeout=30, routing='first'):
         """
         Initializes the CalLibIndex with the provided libraries and configuration.
 
@@ -46,8 +53,24 @@ class CalLibIndex(object):
             Configuration for remote libraries, either as a JSON file path or a list of configurations.
         local : bool, optional
             If True, adds the `LocalCal` library to the index (default is True).
+        timeout : float, optional
+            Default seconds to wait for each remote host to connect (default is 30). None waits forever.
+        routing : str, optional
+            How a name served by several remote hosts is resolved. `first` returns the first library
+            having it; `balance` returns a `CalBlockBalanced` pooling all of them (default is `first`).
         """
-        self._libs = [arg for arg in args if isinstance(arg, CalBlockLib)]
+        if routing not in ('first', 'balance'):
+            raise ValueError(f'Unknown routing mode: {routing}')
+        self.routing = routing
+        self.timeout = timeout
+        self._unavailable = []
+        self._libs = []
+        self._index = {}
+        self._resolved = {}
+        self._size = 0
+        for arg in args:
+            if isinstance(arg, CalBlockLib):
+                self.add(arg)
         if local:
             self.add(LocalCal)
         if config is not None:
@@ -55,7 +78,7 @@ class CalLibIndex(object):
 
     def add(self, lib):
         """
-        Adds a library to the index.
+        Adds a library to the index and registers its algorithms in the name index.
 
         Parameters:
         -----------
@@ -63,6 +86,10 @@ class CalLibIndex(object):
             A library to add to the library index.
         """
         self._libs.append(lib)
+        for _name in lib.algorithms:
+            self._index.setdefault(_name, []).append((lib.source, lib))
+        self._size += len(lib)
+        self._resolved.clear()
 
     def __len__(self):
         """
@@ -73,7 +100,7 @@ class CalLibIndex(object):
         int
             The total number of algorithms in the index.
         """
-        return sum([len(_lib) for _lib in self._libs])
+        return self._size
 
     def __repr__(self):
         """
@@ -84,7 +111,20 @@ class CalLibIndex(object):
         str
             A string representation of the library index.
         """
-        return f'< LibIndex[{len(self._libs)} libs] {len(self)} Algorithms >'
+        _unavailable = f' {len(self._unavailable)} Unavailable' if len(self._unavailable) > 0 else ''
+        return f'< LibIndex[{len(self._libs)} libs] {len(self)} Algorithms{_unavailable} >'
+
+    @property
+    def unavailable(self):
+        """
+        A property that returns the hosts that could not be connected.
+
+        Returns:
+        --------
+        list
+            The host URLs of unavailable remote libraries.
+        """
+        return [item['host'] for item in self._unavailable]
 
     def __getitem__(self, key):
         """
@@ -108,6 +148,77 @@ class CalLibIndex(object):
         IndexError
             If the algorithm is not found.
         """
+        if isinstance(key, str) and key in self._resolved:
+            return self._resolved[key]
+        _name, _sources = self._parse_key(key)
+
+        _blocks = self._index.get(_name)
+        if not _blocks:
+            raise IndexError(f'{_name} Not Found.')
+        _balanced = self._balance(_name, _sources) if self.routing == 'balance' else None
+        if _balanced is not None:
+            _block = _balanced
+        elif _sources is None:
+            _block = _blocks[0][1][_name]
+        else:
+            _lib = self._match_source(_blocks, _sources)
+            if _lib is None:
+                raise IndexError(f'{_name} exists in {[_block[0] for _block in _blocks]}')
+            _block = _lib[_name]
+        if isinstance(key, str):
+            self._resolved[key] = _block
+        return _block
+
+    def _balance(self, name, sources=None):
+        """
+        Builds a factory of a `CalBlockBalanced` pooling the remote libraries serving an algorithm.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the algorithm.
+        sources : list, optional
+            The sources to pool. If None, every remote library serving the algorithm is pooled,
+            unless a non-remote library takes precedence.
+
+        Returns:
+        --------
+        function or None
+            A callable creating the balanced block, or None if fewer than two remote libraries match.
+        """
+        _blocks = self._index.get(name, [])
+        if sources is None:
+            if not _blocks or not isinstance(_blocks[0][1], RemoteCalBlockLib):
+                return None
+            _libs = [_lib for _, _lib in _blocks if isinstance(_lib, RemoteCalBlockLib)]
+        else:
+            _libs = [_lib for _source in sources for _lib_source, _lib in _blocks
+                     if _lib_source == _source and isinstance(_lib, RemoteCalBlockLib)]
+        if len(_libs) < 2:
+            return None
+        _algorithms = [_lib._lib[name] for _lib in _libs]
+        return lambda **kwargs: CalBlockBalanced(_algorithms, **kwargs)
+
+    @staticmethod
+    def _parse_key(key):
+        """
+        Parses an index key into the algorithm name and the list of requested sources.
+
+        Parameters:
+        -----------
+        key : str or tuple
+            The name of the algorithm, optionally as `name:source1,source2` or `(name, sources)`.
+
+        Returns:
+        --------
+        tuple
+            The algorithm name and the list of sources (None if not specified).
+
+        Raises:
+        -------
+        TypeError
+            If the key is not a string or tuple.
+        """
         _sources = None
         if isinstance(key, tuple):
             _name = key[0]
@@ -124,17 +235,30 @@ class CalLibIndex(object):
         if _sources is not None:
             if isinstance(_sources, str):
                 _sources = [_source for _source in _sources.split(',') if len(_source) > 0]
+        return _name, _sources
 
-        _blocks = [(_lib.source, _lib[_name]) for _lib in self._libs if _name in _lib]
-        if len(_blocks) <= 0:
-            raise IndexError(f'{_name} Not Found.')
-        if _sources is None:
-            return _blocks[0][1]
-        for _source in _sources:
-            for _block in _blocks:
+    @staticmethod
+    def _match_source(blocks, sources):
+        """
+        Selects the first library whose source appears in the requested sources, in source order.
+
+        Parameters:
+        -----------
+        blocks : list
+            The `(source, library)` pairs registered for an algorithm name.
+        sources : list
+            The requested sources in priority order.
+
+        Returns:
+        --------
+        CalBlockLib or None
+            The matched library, or None if no source matches.
+        """
+        for _source in sources:
+            for _block in blocks:
                 if _source == _block[0]:
                     return _block[1]
-        raise IndexError(f'{_name} exists in {[_block[0] for _block in _blocks]}')
+        return None
 
     def __contains__(self, name):
         """
@@ -160,14 +284,9 @@ class CalLibIndex(object):
             _sources = [_source for _source in _sources.split(',') if len(_source) > 0]
             if len(_sources) <= 0:
                 raise IndexError('Empty Source!')
-            else:
-                for _source in _sources:
-                    for _lib in self._libs:
-                        if _name in _lib and _lib.source == _source:
-                            return True
-                return False
+            return self._match_source(self._index.get(_name, []), _sources) is not None
         else:
-            return any([name in _lib for _lib in self._libs])
+            return name in self._index
 
     def _repr_markdown_(self):
         """
@@ -178,10 +297,13 @@ class CalLibIndex(object):
         str
             A markdown formatted string representing the library index.
         """
+        import docflow as doc
         _doc = doc.Document(
             doc.Title('LibIndex', level=2),
             doc.Text(f'`{len(self._libs)} libs` `{len(self)} Algorithms`\n\n'),
-            *[doc.Text(_lib._repr_markdown_() + '\n\n') for _lib in self._libs]
+            *[doc.Text(_lib._repr_markdown_() + '\n\n') for _lib in self._libs],
+            *([doc.Title('Unavailable', level=3), doc.Text(''.join([f'- {_host}\n' for _host in self.unavailable]))]
+              if len(self._unavailable) > 0 else []),
         )
         return _doc.markdown
 
@@ -189,6 +311,10 @@ class CalLibIndex(object):
         """
         Loads the configuration for remote libraries from a file or list.
 
+        All hosts are connected concurrently. A host that fails or does not connect within its
+        timeout (`connect_timeout` in its configuration, or the index `timeout`) is marked
+        unavailable with a warning instead of blocking the index.
+
         Parameters:
         -----------
         config : str, list, or file-like object
@@ -218,7 +344,44 @@ class CalLibIndex(object):
                 item['api_key'] = os.environ.get('EASYAPI_KEY')
                 if item['api_key'] is None:
                     raise KeyError('API Key did not provide')
-            self.add(RemoteCalBlockLib(**item))
+
+        _results = [{} for _ in _config]
+        _threads = []
+        for item, _result in zip(_config, _results):
+            _kwargs = {_key: _val for _key, _val in item.items() if _key != 'connect_timeout'}
+            _thread = threading.Thread(target=self._connect, args=(_kwargs, _result), daemon=True)
+            _thread.start()
+            _threads.append(_thread)
+
+        _start = time.monotonic()
+        for item, _result, _thread in zip(_config, _results, _threads):
+            _timeout = item.get('connect_timeout', self.timeout)
+            if _timeout is not None:
+                _timeout = max(0, _start + _timeout - time.monotonic())
+            _thread.join(_timeout)
+            if 'lib' in _result:
+                self.add(_result['lib'])
+            else:
+                _reason = _result.get('error', f'no response in {item.get("connect_timeout", self.timeout)}s')
+                warnings.warn(f'Remote library {item["host"]} unavailable: {_reason}')
+                self._unavailable.append(item)
+
+    @staticmethod
+    def _connect(config, result):
+        """
+        Connects a remote library and stores it (or the connection error) in `result`.
+
+        Parameters:
+        -----------
+        config : dict
+            The keyword arguments of `RemoteCalBlockLib`.
+        result : dict
+            The dictionary receiving `lib` on success or `error` on failure.
+        """
+        try:
+            result['lib'] = RemoteCalBlockLib(**config)
+        except Exception as e:
+            result['error'] = e
 
     def save(self, path=None, save_credentials=False):
         """
@@ -247,11 +410,14 @@ class CalLibIndex(object):
         for _lib in self._libs:
             if isinstance(_lib, RemoteCalBlockLib):
                 if save_credentials:
-                    _save_dict.append({'host': _lib.client.host,
-                                        'api_id': _lib.client.api_id,
-                                        'api_key': _lib.client.api_key})
+                    _save_dict.append({'host': _lib.url,
+                                        'api_id': _lib._pool.api_id or _lib.client.api_id,
+                                        'api_key': _lib._pool.api_key or _lib.client.api_key})
                 else:
-                    _save_dict.append({'host': _lib.client.host})
+                    _save_dict.append({'host': _lib.url})
+        for item in self._unavailable:
+            _save_dict.append({_key: _val for _key, _val in item.items()
+                               if save_credentials or _key not in ('api_id', 'api_key')})
         _save = json.dumps(_save_dict)
         if path is None:
             return _save
@@ -7,18 +7,22 @@ and provides functionality to manage and load them. The class supports adding wo
 retrieving them by name, and rendering information about them. It also provides functionality 
 to load a workbench from a configuration file.
 
+Workflows (and the library index they need) are resolved on first use, and a resolved workbench 
+can be saved to a snapshot file that loads again without any network round trip.
+
 Modules:
 --------
 - `WorkBench`: A class that manages a collection of workflows and their associated toolkits.
 """
 
 from uuid import uuid4
+import pickle
 import json
 import os
-import docflow as doc
 
 from ._workflow import Workflow
 from ._lib_index import CalLibIndex
+from .calblock._lib import RemoteCalBlockLib
 
 
 class WorkBench(object):
@@ -29,10 +33,12 @@ class WorkBench(object):
     -----------
     _id : str
         A unique identifier for the workbench.
-    _index : CalLibIndex
-        An index of libraries used in the workflows.
+    _index : CalLibIndex or callable
+        An index of libraries used in the workflows, or a callable building it on first use.
     _workflows : dict
-        A dictionary of workflows, keyed by their names.
+        A dictionary of workflows (or their configurations until resolved), keyed by their names.
+    _combined : dict
+        A dictionary of combined workflows, keyed by the tuple of their names.
     _name : str
         The name of the workbench.
     _desc : str
@@ -54,6 +60,10 @@ class WorkBench(object):
         A property that returns a list of the workflow names.
     load(workbench_config, force_local_credential=False):
         Loads a workbench from a configuration and returns a `WorkBench` instance.
+    save_snapshot(path):
+        Saves the resolved workbench to a snapshot file.
+    load_snapshot(path, api_id=None, api_key=None, credentials=None):
+        Loads a workbench from a snapshot file without connecting to any host.
     """
 
     def __init__(self, index, workflows={}, name='', desc='', id=None):
@@ -62,10 +72,10 @@ class WorkBench(object):
 
         Parameters:
         -----------
-        index : CalLibIndex
-            An index of libraries used in the workflows.
+        index : CalLibIndex or callable
+            An index of libraries used in the workflows, or a callable building it on first use.
         workflows : dict, optional
-            A dictionary of workflows. Defaults to an empty dictionary.
+            A dictionary of workflows or workflow configurations. Defaults to an empty dictionary.
         name : str, optional
             The name of the workbench. Defaults to an empty string.
         desc : str, optional
@@ -75,7 +85,10 @@ class WorkBench(object):
         """
         self._id = str(uuid4()) if id is None else id
         self._index = index
-        self._workflows = workflows
+        self._workflows = dict(workflows)
+        self._configs = {_name: _workflow for _name, _workflow in self._workflows.items()
+                         if not isinstance(_workflow, Workflow)}
+        self._combined = {}
         self._name = name
         self._desc = desc
 
@@ -110,13 +123,14 @@ class WorkBench(object):
         str
             A markdown string describing the workbench and its workflows.
         """
+        import docflow as doc
         return doc.Document(
             doc.Title('WorkBench' if len(self._name) <= 0 else f'{self._name}', level=1),
             doc.Text(self._desc),
             doc.Title('Workflows', level=2),
-            doc.Sequence({_name: f'**{_workflow.name}**: {_workflow.desc}'
-                          for _name, _workflow in self._workflows.items()}),
-            doc.Text(self._index._repr_markdown_()),
+            doc.Sequence({_name: f'**{self._workflow_info(_name, "name")}**: {self._workflow_info(_name, "desc")}'
+                          for _name in self._workflows}),
+            doc.Text(self.toolkits._repr_markdown_()),
         ).markdown
 
     def __getitem__(self, name):
@@ -141,20 +155,64 @@ class WorkBench(object):
             If the provided index is neither a string nor a list/tuple.
         """
         if isinstance(name, (tuple, list)):
-            _selected_workflows = []
-            for _name in name:
-                if _name in self._workflows:
-                    _selected_workflows.append(self._workflows[_name])
-                else:
-                    raise IndexError(f'{_name} Not Found')
-            return Workflow(*_selected_workflows,
-                            name='Combined Workflows',
-                            desc=''.join([_workflow + '> ' for _workflow in name])[:-2])
+            _key = tuple(name)
+            if _key not in self._combined:
+                _selected_workflows = []
+                for _name in name:
+                    if _name in self._workflows:
+                        _selected_workflows.append(self._resolve(_name))
+                    else:
+                        raise IndexError(f'{_name} Not Found')
+                self._combined[_key] = Workflow(*_selected_workflows,
+                                                name='Combined Workflows',
+                                                desc=''.join([_workflow + '> ' for _workflow in name])[:-2])
+            return self._combined[_key]
         elif isinstance(name, str):
-            return self._workflows[name]
+            return self._resolve(name)
         else:
             raise TypeError('Index Type Error')
 
+    def _resolve(self, name):
+        """
+        Resolves a workflow by name, building it from its configuration on first use.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the workflow.
+
+        Returns:
+        --------
+        Workflow
+            The resolved `Workflow` instance.
+        """
+        _workflow = self._workflows[name]
+        if not isinstance(_workflow, Workflow):
+            _workflow = Workflow.load(_workflow, self.toolkits)
+            self._workflows[name] = _workflow
+        return _workflow
+
+    def _workflow_info(self, name, key):
+        """
+        Gets the name or description of a workflow without resolving it.
+
+        Parameters:
+        -----------
+        name : str
+            The name of the workflow.
+        key : str
+            The attribute to get, either `name` or `desc`.
+
+        Returns:
+        --------
+        str
+            The requested attribute.
+        """
+        _workflow = self._workflows[name]
+        if isinstance(_workflow, Workflow):
+            return getattr(_workflow, key)
+        return _workflow.get(key)
+
     @property  
     def toolkits(self):
         """
@@ -165,6 +223,8 @@ class WorkBench(object):
         CalLibIndex
             The index of libraries used in the workflows.
         """
+        if not isinstance(self._index, CalLibIndex):
+            self._index = self._index()
         return self._index
 
     @property
@@ -221,9 +281,80 @@ class WorkBench(object):
                     _lib['api_id'] = _auth['api_id']
                     _lib['api_key'] = _auth['api_key']
 
-        _libs = CalLibIndex(config=_libs)
-        _workflows = {_name: Workflow.load(_workflow, _libs)
-                      for _name, _workflow in workbench_config['workflows'].items()}
-
-        return WorkBench(index=_libs, workflows=_workflows,
+        _routing = workbench_config.get('routing', 'first')
+        return WorkBench(index=lambda: CalLibIndex(config=_libs, routing=_routing),
+                         workflows=workbench_config['workflows'],
                          name=_name, desc=_desc, id=_id)
+
+    def save_snapshot(self, path):
+        """
+        Resolves every workflow and saves the workbench, including the schemas of the remote 
+        algorithms, to a snapshot file. Credentials are not saved.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the snapshot file.
+
+        Raises:
+        -------
+        TypeError
+            If a workflow was not loaded from a configuration.
+        """
+        for _name in self._workflows:
+            if _name not in self._configs:
+                raise TypeError(f'{_name} has no configuration to snapshot')
+            self._resolve(_name)
+        _snapshot = {
+            'name': self._name,
+            'desc': self._desc,
+            'id': self._id,
+            'routing': self.toolkits.routing,
+            'lib': [_lib.snapshot() for _lib in self.toolkits._libs if isinstance(_lib, RemoteCalBlockLib)],
+            'workflows': self._configs,
+        }
+        with open(path, 'wb') as f:
+            pickle.dump(_snapshot, f)
+
+    @staticmethod
+    def load_snapshot(path, api_id=None, api_key=None, credentials=None):
+        """
+        Loads a workbench from a snapshot file without connecting to any host. Hosts are 
+        connected on the first request sent to them.
+
+        Each host uses its entry in `credentials`, if any, and `api_id` and `api_key` otherwise.
+
+        Parameters:
+        -----------
+        path : str
+            The path of the snapshot file.
+        api_id : str, optional
+            The API ID for authentication. Defaults to the `EASYAPI_ID` environment variable.
+        api_key : str, optional
+            The API key for authentication. Defaults to the `EASYAPI_KEY` environment variable.
+        credentials : dict, optional
+            The credentials of each host, as a dictionary mapping the host URL (or the server name) to a
+            dictionary with `api_id` and `api_key`. A `lib` list of a workbench configuration, whose entries
+            hold `host`, `api_id`, and `api_key`, is also accepted.
+
+        Returns:
+        --------
+        WorkBench
+            A `WorkBench` instance created from the snapshot.
+        """
+        with open(path, 'rb') as f:
+            _snapshot = pickle.load(f)
+        api_id = os.environ.get('EASYAPI_ID') if api_id is None else api_id
+        api_key = os.environ.get('EASYAPI_KEY') if api_key is None else api_key
+
+        if isinstance(credentials, list):
+            credentials = {_lib['host']: _lib for _lib in credentials if 'host' in _lib}
+        credentials = {} if credentials is None else credentials
+
+        _libs = CalLibIndex(routing=_snapshot.get('routing', 'first'))
+        for _lib in _snapshot['lib']:
+            _auth = credentials.get(_lib['host'], credentials.get(_lib.get('server'), {}))
+            _libs.add(RemoteCalBlockLib.from_snapshot(_lib, api_id=_auth.get('api_id', api_id),
+                                                      api_key=_auth.get('api_key', api_key)))
+        return WorkBench(index=_libs, workflows=_snapshot['workflows'],
+                         name=_snapshot['name'], desc=_snapshot['desc'], id=_snapshot['id'])
@@ -5,6 +5,7 @@ CalBlock Core Module
 This module serves as the central hub for importing core CalBlock components, including:
 - CalBlock: The foundational class for creating computational blocks.
 - CalBlockRemote: Extends CalBlock for remote execution capabilities.
+- CalBlockBalanced: Extends CalBlock to balance a remote algorithm across several hosts.
 - CalBlockLib: The base library class for managing collections of CalBlocks.
 - RemoteCalBlockLib: Manages libraries of remotely accessible CalBlocks.
 - LocalCalBlockLib: Manages libraries of locally defined CalBlocks.
@@ -16,6 +17,7 @@ Affiliation: Computer Science Department, Tulane University
 
 from ._calblock import CalBlock
 from ._calblock_remote import CalBlockRemote
+from ._calblock_balanced import CalBlockBalanced
 
 from ._lib import CalBlockLib
 from ._lib import RemoteCalBlockLib
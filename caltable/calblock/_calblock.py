@@ -12,15 +12,18 @@ Email: jli78@tulane.edu
 Affiliation: Computer Science Department, Tulane University
 """
 
-import docflow as doc
-
 
 class CalBlock:
     """
     A computational block class for handling input-output mappings 
     and computations with tabular data.
+
+    Values kept on disk (see `BlobHandle`) are read before they are passed to `forward`, unless
+    `by_reference` is True, in which case `forward` receives their handles.
     """
 
+    by_reference = False
+
     def __init__(self, name=None, host='local', inputs=None, outputs=None, desc='', **kwargs):
         """
         Initialize the CalBlock instance.
@@ -59,7 +62,8 @@ class CalBlock:
             if col_name in table.columns:
                 _param = table[row, col_name]
                 if _param is not None:
-                    _inputs[param] = _param.value
+                    _handle = _param.handle if self.by_reference else None
+                    _inputs[param] = _param.value if _handle is None else _handle
         return _inputs
 
     def _assign_output(self, table, row=0, outputs=None, params=None):
@@ -147,6 +151,7 @@ class CalBlock:
         Returns:
             str: Markdown-formatted string.
         """
+        import docflow as doc
         _doc = doc.Document(
             doc.Title(self.name, level=3),
             doc.Text(f'\n{self.desc}  \n'),
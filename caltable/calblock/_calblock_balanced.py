@@ -0,0 +1,121 @@
+"""
+CalBlockBalanced Module
+=======================
+
+This module extends the `CalBlock` functionality to route one algorithm over several equivalent
+remote hosts. Rows are dispatched to the host with the fewest outstanding requests, and a request
+that cannot reach one host or times out on it is retried on the next one.
+
+Author: Jiarui Li
+Email: jli78@tulane.edu
+Affiliation: Computer Science Department, Tulane University
+"""
+
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from ._calblock import CalBlock
+from ._calblock_remote import CalBlockRemote
+
+
+class CalBlockBalanced(CalBlock):
+    """
+    A subclass of CalBlock distributing a remote algorithm across several hosts.
+    """
+
+    def __init__(self, remote_algorithms, cooldown=30, workers=None, **kwargs):
+        """
+        Initialize the CalBlockBalanced instance.
+
+        Args:
+            remote_algorithms (list): Equivalent `RemoteAlgorithm` handles served by different hosts.
+                The schema of the first one is used for the block.
+            cooldown (float): Seconds a failed host is tried last. Defaults to 30.
+            workers (int, optional): Number of rows processed concurrently. Defaults to the total pool size.
+            **kwargs: Additional keyword arguments for column mapping.
+        """
+        self.remote_algorithms = list(remote_algorithms)
+        self.cooldown = cooldown
+        self.workers = workers
+        self._failures = {}
+        self._dispatched = [0] * len(self.remote_algorithms)
+        self._lock = threading.Lock()
+        _algorithm = self.remote_algorithms[0]
+        super().__init__(
+            name=_algorithm.name,
+            host=', '.join([str(_algorithm._lib.source) for _algorithm in self.remote_algorithms]),
+            inputs=_algorithm.inputs,
+            outputs=_algorithm.outputs,
+            desc=_algorithm.description,
+            **kwargs
+        )
+
+    def __repr__(self):
+        """
+        String representation of the CalBlockBalanced instance.
+
+        Returns:
+            str: The representation string.
+        """
+        return f'<{self.host}[BALANCED]: {self.name}>'
+
+    def _ranked(self):
+        """
+        Rank the hosts by recent failure, outstanding requests, and dispatched requests.
+
+        Returns:
+            list: Indices of `remote_algorithms` in the order they should be tried.
+        """
+        _now = time.monotonic()
+        with self._lock:
+            _ranked = sorted(range(len(self.remote_algorithms)),
+                             key=lambda i: (_now - self._failures.get(i, -self.cooldown) < self.cooldown,
+                                            self.remote_algorithms[i]._lib._pool.outstanding,
+                                            self._dispatched[i]))
+            self._dispatched[_ranked[0]] += 1
+        return _ranked
+
+    def forward(self, **inputs):
+        """
+        Execute the remote algorithm on the least busy host, failing over to the others on connection errors
+        and timeouts. Other errors, such as a host rejecting the inputs, are raised right away.
+
+        Args:
+            **inputs: Input parameters for the remote algorithm.
+
+        Returns:
+            dict: Output parameters returned by the remote algorithm.
+
+        Raises:
+            OSError: The last connection error or timeout if every host fails.
+            Exception: Any other error raised by the host.
+        """
+        _error = None
+        inputs = CalBlockRemote._serialize(inputs)
+        for _index in self._ranked():
+            try:
+                return self.remote_algorithms[_index](**inputs)
+            except OSError as e:  # Connection errors and timeouts, including those of requests
+                with self._lock:
+                    self._failures[_index] = time.monotonic()
+                _error = e
+        raise _error
+
+    def forward_table(self, table):
+        """
+        Perform forward computation for each row in the table, with rows processed concurrently.
+
+        Args:
+            table: The data table to process.
+
+        Returns:
+            table: The updated table with computed values.
+        """
+        _workers = self.workers
+        if _workers is None:
+            _workers = sum([_algorithm._lib._pool.pool_size for _algorithm in self.remote_algorithms])
+        _inputs = [self._fetch_input(table, row=row, params=self.inputs) for row in range(len(table))]
+        with ThreadPoolExecutor(max_workers=max(1, _workers)) as executor:
+            for row, _outputs in enumerate(executor.map(lambda _row_inputs: self.forward(**_row_inputs), _inputs)):
+                self._assign_output(table, row=row, outputs=_outputs, params=self.outputs)
+        return table
@@ -11,7 +11,9 @@ Email: jli78@tulane.edu
 Affiliation: Computer Science Department, Tulane University
 """
 
+import numpy as np
 from ._calblock import CalBlock
+from ..type_engine import BlobHandle
 
 
 class CalBlockRemote(CalBlock):
@@ -30,7 +32,7 @@ class CalBlockRemote(CalBlock):
         self.remote_algorithm = remote_algorithm
         super().__init__(
             name=remote_algorithm.name,
-            host=remote_algorithm._client._server_info,
+            host=getattr(remote_algorithm, 'server_info', None) or remote_algorithm._client._server_info,
             inputs=remote_algorithm.inputs,
             outputs=remote_algorithm.outputs,
             desc=remote_algorithm.description,
@@ -56,4 +58,23 @@ class CalBlockRemote(CalBlock):
         Returns:
             dict: Output parameters returned by the remote algorithm.
         """
-        return self.remote_algorithm(**inputs)
+        return self.remote_algorithm(**self._serialize(inputs))
+
+    @staticmethod
+    def _serialize(inputs):
+        """
+        Convert NumPy arrays in the inputs to lists and read values kept on disk, so they can be sent
+        to the remote server.
+
+        Args:
+            inputs (dict): Input parameters.
+
+        Returns:
+            dict: Input parameters with NumPy arrays converted to lists and handles read.
+        """
+        _serialized = {}
+        for key, val in inputs.items():
+            if isinstance(val, np.ndarray): val = val.tolist()
+            elif isinstance(val, BlobHandle): val = val.read()
+            _serialized[key] = val
+        return _serialized
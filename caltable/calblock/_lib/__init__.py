@@ -5,6 +5,8 @@ CalBlock Library Module
 This module provides unified access to CalBlock libraries, including:
 - LocalCalBlockLib: A library of locally defined CalBlocks.
 - RemoteCalBlockLib: A library of remotely accessible CalBlocks integrated with EasyAccess.
+- RemoteMetaCache: An on-disk cache of remote algorithm metadata.
+- RemotePool: A pooled transport shared by the remote libraries of one host.
 
 Author: Jiarui Li  
 Email: jli78@tulane.edu  
@@ -14,3 +16,5 @@ Affiliation: Computer Science Department, Tulane University
 from ._calblock_lib import CalBlockLib
 from ._calblock_remote_lib import RemoteCalBlockLib
 from ._calblock_local_lib import LocalCalBlockLib
+from ._calblock_remote_cache import RemoteMetaCache
+from ._calblock_remote_pool import RemotePool
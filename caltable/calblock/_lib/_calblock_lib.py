@@ -10,8 +10,6 @@ Email: jli78@tulane.edu
 Affiliation: Computer Science Department, Tulane University
 """
 
-import docflow as doc
-
 
 class CalBlockLib:
     """
@@ -88,8 +86,9 @@ class CalBlockLib:
         Returns:
             str: The Markdown string.
         """
+        import docflow as doc
         _doc = doc.Document(
             doc.Title(self.source, level=3),
-            doc.Sequence({key: val().desc for key, val in self._lib.items()})
+            doc.Sequence({key: self[key]().desc for key in self._lib})
         )
         return _doc.markdown
@@ -4,6 +4,7 @@ LocalCalBlockLib Module
 
 This module defines a specialized `CalBlockLib` for managing locally registered CalBlock algorithms.
 It provides static methods for registering blocks with unique names and resolving conflicts.
+Blocks can also be registered lazily by name, so their modules are only imported on first use.
 
 Author: Jiarui Li
 Email: jli78@tulane.edu
@@ -14,6 +15,23 @@ import warnings
 from ._calblock_lib import CalBlockLib
 
 
+class _LazyBlock:
+    """
+    A placeholder of a lazily registered block, holding the loader that imports it.
+    """
+
+    def __init__(self, name, loader):
+        """
+        Initialize the _LazyBlock instance.
+
+        Args:
+            name (str): The name of the block.
+            loader: An object whose `load()` returns the block, such as an entry point.
+        """
+        self.name = name
+        self.loader = loader
+
+
 class LocalCalBlockLib(CalBlockLib):
     """
     A library for managing local CalBlock algorithms.
@@ -21,12 +39,69 @@ class LocalCalBlockLib(CalBlockLib):
 
     _type = 'local'
     _blocks = {}
+    _lazy_blocks = {}
+    _loading = set()
 
     def __init__(self):
         """
         Initialize the LocalCalBlockLib instance using the locally registered blocks.
         """
-        super().__init__(source=self._type, **self._blocks)
+        super().__init__(source=self._type, **{**self._lazy_blocks, **self._blocks})
+
+    def __getitem__(self, name):
+        """
+        Access an algorithm by its name, loading it first if it was registered lazily.
+
+        Args:
+            name (str): The name of the algorithm.
+
+        Returns:
+            Callable: The corresponding algorithm class or function.
+        """
+        _block = self._lib[name]
+        if isinstance(_block, _LazyBlock):
+            _block = self._load_block(name)
+            self._lib[name] = _block
+        return _block
+
+    @classmethod
+    def _load_block(cls, name):
+        """
+        Load a lazily registered block and register it.
+
+        Args:
+            name (str): The name of the block.
+
+        Returns:
+            Callable: The loaded block.
+        """
+        _lazy = cls._lazy_blocks.get(name)
+        if _lazy is not None:
+            cls._loading.add(name)  # A module registering its own block while loading is not a conflict
+            try:
+                _block = _lazy.loader.load()  # The registration is kept if loading fails
+            finally:
+                cls._loading.discard(name)
+            cls._lazy_blocks.pop(name, None)
+            if name not in cls._blocks:
+                cls._blocks[name] = _block
+        return cls._blocks[name]
+
+    @classmethod
+    def register_lazy(cls, name, loader):
+        """
+        Register a CalBlock algorithm by name without importing it.
+
+        Args:
+            name (str): The unique name for the block.
+            loader: An object whose `load()` returns the block, such as an entry point.
+
+        Warnings:
+            Issues a warning if a block with the same name already exists.
+        """
+        if name in cls._blocks or name in cls._lazy_blocks:
+            warnings.warn(f'Local block conflict: {name} already exists.')
+        cls._lazy_blocks[name] = _LazyBlock(name, loader)
 
     @classmethod
     def register_block(cls, block, name=None):
@@ -38,12 +113,14 @@ class LocalCalBlockLib(CalBlockLib):
             name (str, optional): The unique name for the block. If None, defaults to `block.name`.
 
         Warnings:
-            Issues a warning if a block with the same name already exists.
+            Issues a warning if a block with the same name already exists, other than the lazy entry
+            of the block being loaded.
         """
         if name is None:
             name = block.name
-        if name in cls._blocks:
+        if name in cls._blocks or (name in cls._lazy_blocks and name not in cls._loading):
             warnings.warn(f'Local block conflict: {name} already exists.')
+            cls._lazy_blocks.pop(name, None)
         cls._blocks[name] = block
 
     @classmethod
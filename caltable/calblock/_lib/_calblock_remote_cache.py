@@ -0,0 +1,109 @@
+"""
+RemoteMetaCache Module
+======================
+
+This module provides an on-disk cache for remote algorithm metadata (algorithm names, descriptions,
+and input/output schemas). Cached entries are keyed by the host URL and are only reused while they
+are younger than the configured TTL and were recorded against the same server version.
+
+Author: Jiarui Li
+Email: jli78@tulane.edu
+Affiliation: Computer Science Department, Tulane University
+"""
+
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+import warnings
+
+
+class RemoteMetaCache:
+    """
+    A file-based cache of remote algorithm metadata, one file per host.
+    """
+
+    def __init__(self, path=None, ttl=86400):
+        """
+        Initialize the RemoteMetaCache instance.
+
+        Args:
+            path (str, optional): The cache directory. Defaults to `$CALTABLE_CACHE_DIR` or `~/.cache/caltable/remote`.
+            ttl (float, optional): Seconds before a cached entry expires. None means entries never expire.
+        """
+        if path is None:
+            path = os.environ.get('CALTABLE_CACHE_DIR',
+                                  os.path.join(os.path.expanduser('~'), '.cache', 'caltable'))
+            path = os.path.join(path, 'remote')
+        self.path = path
+        self.ttl = ttl
+
+    def _file(self, host):
+        """
+        Get the cache file path for a host.
+
+        Args:
+            host (str): The host URL.
+
+        Returns:
+            str: The cache file path.
+        """
+        return os.path.join(self.path, hashlib.sha1(str(host).encode()).hexdigest() + '.pkl')
+
+    def load(self, host, server=None):
+        """
+        Load the cached entry of a host if it is still valid.
+
+        Args:
+            host (str): The host URL.
+            server (str, optional): The current server information. If given, entries recorded
+                against a different server version are ignored.
+
+        Returns:
+            dict or None: The cached entry, or None if missing, expired, or stale.
+        """
+        try:
+            with open(self._file(host), 'rb') as f:
+                _entry = pickle.load(f)
+        except Exception:
+            return None
+        if self.ttl is not None and time.time() - _entry.get('time', 0) > self.ttl:
+            return None
+        if server is not None and _entry.get('server') != server:
+            return None
+        return _entry
+
+    def save(self, host, entry):
+        """
+        Save the entry of a host atomically.
+
+        Args:
+            host (str): The host URL.
+            entry (dict): The metadata entry to save.
+        """
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            _fd, _tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(_fd, 'wb') as f:
+                pickle.dump(entry, f)
+            os.replace(_tmp, self._file(host))
+        except Exception as e:
+            warnings.warn(f'Failed to cache metadata of {host}: {e}')
+
+    def clear(self, host=None):
+        """
+        Remove the cached entry of a host, or all cached entries.
+
+        Args:
+            host (str, optional): The host URL. If None, all entries are removed.
+        """
+        if host is not None:
+            _files = [self._file(host)]
+        elif os.path.isdir(self.path):
+            _files = [os.path.join(self.path, _f) for _f in os.listdir(self.path) if _f.endswith('.pkl')]
+        else:
+            _files = []
+        for _file in _files:
+            if os.path.isfile(_file):
+                os.remove(_file)
@@ -5,15 +5,121 @@ RemoteCalBlockLib Module
 This module defines a specialized `CalBlockLib` for managing remotely accessible CalBlock algorithms.
 It integrates with the EasyAccess client to fetch and utilize remote algorithms.
 
+Algorithm discovery is lazy: only the algorithm list is fetched when the library is created, and the
+input/output schema of an algorithm is fetched on its first use. Both are kept in an on-disk
+`RemoteMetaCache` so later sessions against the same server version skip the round trips.
+Requests go through a `RemotePool` shared by every library pointing at the same host.
+
 Author: Jiarui Li
 Email: jli78@tulane.edu
 Affiliation: Computer Science Department, Tulane University
 """
 
+import time
 from ._calblock_lib import CalBlockLib
+from ._calblock_remote_cache import RemoteMetaCache
+from ._calblock_remote_pool import RemotePool
 from .._calblock_remote import CalBlockRemote
-import docflow as doc
-from easyaccess import EasyAccess
+
+
+class RemoteAlgorithm:
+    """
+    A lazy handle of a remote algorithm whose schema is fetched on first access.
+    """
+
+    def __init__(self, lib, name):
+        """
+        Initialize the RemoteAlgorithm instance.
+
+        Args:
+            lib (RemoteCalBlockLib): The library serving the algorithm.
+            name (str): The name of the remote algorithm.
+        """
+        self._lib = lib
+        self.name = name
+
+    def __repr__(self):
+        """
+        String representation of the RemoteAlgorithm instance.
+
+        Returns:
+            str: The representation string.
+        """
+        return f'<{self._lib.source}[REMOTE]: {self.name}>'
+
+    @property
+    def description(self):
+        """
+        The description of the remote algorithm.
+
+        Returns:
+            str: The algorithm description.
+        """
+        return self._lib._schema(self.name)['description']
+
+    @property
+    def inputs(self):
+        """
+        The input parameter definitions of the remote algorithm.
+
+        Returns:
+            dict: The input parameters.
+        """
+        return self._lib._schema(self.name)['inputs']
+
+    @property
+    def outputs(self):
+        """
+        The output parameter definitions of the remote algorithm.
+
+        Returns:
+            dict: The output parameters.
+        """
+        return self._lib._schema(self.name)['outputs']
+
+    @property
+    def server_info(self):
+        """
+        The information of the server serving the algorithm, known without connecting.
+
+        Returns:
+            str: The server information.
+        """
+        return self._lib.host
+
+    @property
+    def _client(self):
+        """
+        The EasyAccess client serving the algorithm.
+
+        Returns:
+            EasyAccess: The client.
+        """
+        return self._lib.client
+
+    def __call__(self, **inputs):
+        """
+        Execute the remote algorithm with the given inputs.
+
+        Args:
+            **inputs: Input parameters for the remote algorithm.
+
+        Returns:
+            dict: Output parameters returned by the remote algorithm.
+        """
+        return self._lib._pool.call(self.name, **inputs)
+
+    def submit(self, **inputs):
+        """
+        Submit the remote algorithm to the host pool without waiting for it.
+
+        Args:
+            **inputs: Input parameters for the remote algorithm.
+
+        Returns:
+            Future: A future resolving to the output parameters.
+        """
+        return self._lib._pool.submit(self.name, **inputs)
 
 
 class RemoteCalBlockLib(CalBlockLib):
@@ -21,7 +127,9 @@ class RemoteCalBlockLib(CalBlockLib):
     A library for managing remotely accessible CalBlock algorithms.
     """
 
-    def __init__(self, client=None, host=None, api_id=None, api_key=None):
+    def __init__(self, client=None, host=None, api_id=None, api_key=None,
+                 cache=True, cache_ttl=86400, cache_dir=None,
+                 pool_size=None, timeout=None, keep_alive=None):
         """
         Initialize the RemoteCalBlockLib with an EasyAccess client.
 
@@ -30,17 +138,110 @@ class RemoteCalBlockLib(CalBlockLib):
             host (str, optional): The host URL for the remote server.
             api_id (str, optional): The API ID for authentication.
             api_key (str, optional): The API key for authentication.
+            cache (bool, optional): If True, algorithm metadata is cached on disk. Defaults to True.
+            cache_ttl (float, optional): Seconds before the cached metadata expires. Defaults to one day.
+            cache_dir (str, optional): The cache directory. Defaults to `$CALTABLE_CACHE_DIR` or `~/.cache/caltable`.
+            pool_size (int, optional): The maximum number of concurrent requests to the host. Defaults to 8.
+            timeout (float, optional): Seconds to wait for each request. Defaults to no timeout.
+            keep_alive (bool, optional): If True, the connection is reused and only rebuilt after a connection error. Defaults to True.
+
+        The pool settings only apply when this library is the first one connecting to the host.
         """
+        _options = {_key: _val for _key, _val in dict(pool_size=pool_size, timeout=timeout,
+                                                      keep_alive=keep_alive).items() if _val is not None}
         if client is None:
-            client = EasyAccess(host=host, api_id=api_id, api_key=api_key)
+            self._pool = RemotePool.get(host, api_id=api_id, api_key=api_key, **_options)
+        else:
+            self._pool = RemotePool(client=client, **_options)
 
-        self.client = client
+        client = self.client
         _host = client._server_info
         self.host = _host
+        self.url = getattr(client, 'host', host)
+
+        self._cache = RemoteMetaCache(path=cache_dir, ttl=cache_ttl) if cache else None
+        self._entry = self._cache.load(self.url, server=_host) if self._cache is not None else None
+        if self._entry is None:
+            self._entry = {'server': _host, 'time': time.time(),
+                           'algorithms': list(client.algorithms), 'schemas': {}}
+            self._save_entry()
 
-        _blocks = {algo_name: algorithm for algo_name, algorithm in client[client.algorithms].items()}
+        _blocks = {algo_name: RemoteAlgorithm(self, algo_name) for algo_name in self._entry['algorithms']}
         super().__init__(source=_host, **_blocks)
 
+    def snapshot(self):
+        """
+        Export the host URL and the known algorithm metadata, without credentials.
+
+        Returns:
+            dict: The snapshot of the library.
+        """
+        return dict(self._entry, host=self.url,
+                    schemas=dict(self._entry['schemas']))
+
+    @classmethod
+    def from_snapshot(cls, snapshot, api_id=None, api_key=None, **kwargs):
+        """
+        Rebuild a library from a snapshot without connecting to the host.
+        The connection is established on the first request.
+
+        Args:
+            snapshot (dict): The snapshot exported by `snapshot()`.
+            api_id (str, optional): The API ID for authentication.
+            api_key (str, optional): The API key for authentication.
+            **kwargs: `pool_size`, `timeout`, and `keep_alive` settings of the host pool.
+
+        Returns:
+            RemoteCalBlockLib: The library.
+        """
+        _lib = cls.__new__(cls)
+        _lib._pool = RemotePool.get(snapshot['host'], api_id=api_id, api_key=api_key,
+                                    **{_key: _val for _key, _val in kwargs.items() if _val is not None})
+        _lib.host = snapshot['server']
+        _lib.url = snapshot['host']
+        _lib._cache = None
+        _lib._entry = {_key: _val for _key, _val in snapshot.items() if _key != 'host'}
+        _blocks = {algo_name: RemoteAlgorithm(_lib, algo_name) for algo_name in _lib._entry['algorithms']}
+        CalBlockLib.__init__(_lib, source=_lib.host, **_blocks)
+        return _lib
+
+    def _save_entry(self):
+        """
+        Write the metadata entry to the on-disk cache if caching is enabled.
+        """
+        if self._cache is not None:
+            self._cache.save(self.url, self._entry)
+
+    @property
+    def client(self):
+        """
+        The EasyAccess client of the host, shared through the host pool.
+
+        Returns:
+            EasyAccess: The client.
+        """
+        return self._pool.client
+
+    def _schema(self, name):
+        """
+        Get the description and input/output schema of an algorithm, fetching it on first use.
+
+        Args:
+            name (str): The name of the remote algorithm.
+
+        Returns:
+            dict: The schema with `description`, `inputs`, and `outputs`.
+        """
+        _schema = self._entry['schemas'].get(name)
+        if _schema is None:
+            _algorithm = self._pool.algorithm(name)
+            _schema = {'description': _algorithm.description,
+                       'inputs': _algorithm.inputs,
+                       'outputs': _algorithm.outputs}
+            self._entry['schemas'][name] = _schema
+            self._save_entry()
+        return _schema
+
     def __getitem__(self, name):
         """
         Retrieve a CalBlockRemote instance for the specified algorithm.
@@ -60,6 +261,7 @@ class RemoteCalBlockLib(CalBlockLib):
         Returns:
             str: A Markdown-formatted string of the library's contents.
         """
+        import docflow as doc
         _doc = doc.Document(
             doc.Title(self.source, level=3),
             doc.Sequence({key: val.description for key, val in self._lib.items()})
@@ -0,0 +1,273 @@
+"""
+RemotePool Module
+=================
+
+This module provides the `RemotePool` class, a pooled transport shared by every `RemoteCalBlockLib`
+pointing at the same host with the same credentials. The pool owns a single EasyAccess client (so
+the handshake is paid once per host and the client is reused until a connection error), bounds the
+number of in-flight requests, applies per-request timeouts, and exposes futures that thread-pool or async executors can draw from.
+
+Author: Jiarui Li
+Email: jli78@tulane.edu
+Affiliation: Computer Science Department, Tulane University
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from easyaccess import EasyAccess
+
+
+class RemotePool:
+    """
+    A shared, bounded transport for the requests sent to one remote host.
+    """
+
+    _pools = {}
+    _pools_lock = threading.Lock()
+
+    def __init__(self, host=None, api_id=None, api_key=None, client=None,
+                 pool_size=8, timeout=None, keep_alive=True):
+        """
+        Initialize the RemotePool instance.
+
+        Args:
+            host (str, optional): The host URL for the remote server.
+            api_id (str, optional): The API ID for authentication.
+            api_key (str, optional): The API key for authentication.
+            client (EasyAccess, optional): An existing client to use instead of connecting on demand.
+            pool_size (int, optional): The maximum number of concurrent requests. Defaults to 8.
+            timeout (float, optional): Seconds to wait for each request. None waits forever.
+            keep_alive (bool, optional): If True, the client is reused by every request and only rebuilt
+                after a connection error. A request that failed before reaching the server is retried once on
+                the new client. If False,
+                a new client is connected for each request. Defaults to True.
+        """
+        self.host = getattr(client, 'host', host)
+        self.api_id = api_id
+        self.api_key = api_key
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+        self.outstanding = 0
+        self._client = client
+        self._owns_client = client is None
+        self._algorithms = {}
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, host, api_id=None, api_key=None, **kwargs):
+        """
+        Get the shared pool of a host, creating it on first use.
+
+        The settings of the first caller apply to the shared pool.
+
+        Args:
+            host (str): The host URL for the remote server.
+            api_id (str, optional): The API ID for authentication.
+            api_key (str, optional): The API key for authentication.
+            **kwargs: `pool_size`, `timeout`, and `keep_alive` settings of a new pool.
+
+        Returns:
+            RemotePool: The shared pool.
+        """
+        _key = (host, api_id, api_key)
+        with cls._pools_lock:
+            _pool = cls._pools.get(_key)
+            if _pool is None:
+                _pool = cls(host=host, api_id=api_id, api_key=api_key, **kwargs)
+                cls._pools[_key] = _pool
+        return _pool
+
+    def __repr__(self):
+        """
+        String representation of the RemotePool instance.
+
+        Returns:
+            str: The representation string.
+        """
+        return f'<Pool[{self.host}] {self.outstanding}/{self.pool_size} Outstanding>'
+
+    @property
+    def client(self):
+        """
+        The EasyAccess client of the host, connected on first use and kept until a connection error.
+
+        Returns:
+            EasyAccess: The client.
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = EasyAccess(host=self.host, api_id=self.api_id, api_key=self.api_key)
+            return self._client
+
+    def _reconnect(self, client):
+        """
+        Drop a client after a connection error, so that the next request connects again.
+        A client given by the caller is kept, as the pool cannot rebuild it.
+
+        Args:
+            client (EasyAccess): The client the failed request used.
+        """
+        with self._lock:
+            if self._owns_client and self._client is client:
+                self._client = None
+                self._algorithms = {}
+
+    def algorithm(self, name):
+        """
+        Fetch the EasyAccess algorithm object, once per connection.
+
+        Args:
+            name (str): The name of the remote algorithm.
+
+        Returns:
+            Callable: The EasyAccess algorithm object.
+        """
+        _client = self.client
+        _algorithm = self._algorithms.get(name)
+        if _algorithm is None:
+            _algorithm = _client[[name]][name]
+            self._algorithms[name] = _algorithm
+        return _algorithm
+
+    def _get_executor(self):
+        """
+        Get the worker pool that carries the requests, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: The worker pool.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.pool_size,
+                                                    thread_name_prefix=f'caltable-{self.host}')
+            return self._executor
+
+    def _run(self, name, inputs):
+        """
+        Execute a remote algorithm. With `keep_alive`, a connection error rebuilds the client. The request
+        is only sent again when it never reached the server: when the error was raised while fetching the
+        algorithm, or while connecting to send the request. Other errors, such as read timeouts, are
+        raised, as the server may already have run the request.
+
+        Args:
+            name (str): The name of the remote algorithm.
+            inputs (dict): Input parameters for the remote algorithm.
+
+        Returns:
+            dict: Output parameters returned by the remote algorithm.
+        """
+        if not self.keep_alive and self._owns_client:
+            _client = EasyAccess(host=self.host, api_id=self.api_id, api_key=self.api_key)
+            return _client[[name]][name](**inputs)
+        _client = self.client
+        try:
+            _algorithm = self.algorithm(name)
+        except OSError:  # Connection errors, including those of requests, derive from OSError
+            self._reconnect(_client)
+            _algorithm = self.algorithm(name)
+        try:
+            return _algorithm(**inputs)
+        except OSError as e:
+            self._reconnect(_client)
+            if not self._is_connect_error(e): raise
+            return self.algorithm(name)(**inputs)
+
+    @staticmethod
+    def _is_connect_error(error):
+        """
+        Check whether an error was raised while connecting, before a request was sent. The causes of
+        the error are followed, as HTTP clients wrap the socket errors.
+
+        Args:
+            error (BaseException): The error.
+
+        Returns:
+            bool: True for refused connections and connection timeouts.
+        """
+        _connect = {'ConnectionRefusedError', 'ConnectTimeout', 'ConnectTimeoutError', 'NewConnectionError'}
+        _seen, _errors = set(), [error]
+        while _errors:
+            _error = _errors.pop()
+            if not isinstance(_error, BaseException) or id(_error) in _seen: continue
+            _seen.add(id(_error))
+            if _connect & {_type.__name__ for _type in type(_error).__mro__}:
+                return True
+            _errors.extend([_error.__cause__, _error.__context__, getattr(_error, 'reason', None), *_error.args])
+        return False
+
+    def _release(self, future):
+        """
+        Stop counting a request as outstanding, once, when it finishes or is abandoned.
+
+        Args:
+            future (Future): The future of the request.
+        """
+        with self._lock:
+            if future in self._pending:
+                self._pending.discard(future)
+                self.outstanding -= 1
+
+    def submit(self, name, **inputs):
+        """
+        Submit a request to the pool without waiting for it.
+
+        Args:
+            name (str): The name of the remote algorithm.
+            **inputs: Input parameters for the remote algorithm.
+
+        Returns:
+            Future: A future resolving to the output parameters.
+        """
+        with self._lock:
+            self.outstanding += 1
+        try:
+            _future = self._get_executor().submit(self._run, name, inputs)
+        except Exception:
+            with self._lock:
+                self.outstanding -= 1
+            raise
+        with self._lock:
+            self._pending.add(_future)
+        _future.add_done_callback(self._release)
+        return _future
+
+    def call(self, name, **inputs):
+        """
+        Execute a remote algorithm through the pool and wait for its result.
+
+        Args:
+            name (str): The name of the remote algorithm.
+            **inputs: Input parameters for the remote algorithm.
+
+        Returns:
+            dict: Output parameters returned by the remote algorithm.
+
+        A request that times out is no longer counted as outstanding, even if a worker is still running it,
+        so that balancers route new requests away from it.
+
+        Raises:
+            TimeoutError: If the request does not finish within `timeout` seconds.
+        """
+        _future = self.submit(name, **inputs)
+        try:
+            return _future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            _future.cancel()
+            self._release(_future)
+            raise TimeoutError(f'{self.host} did not respond to {name} in {self.timeout}s')
+
+    def close(self):
+        """
+        Shut down the worker pool and drop the connection.
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._owns_client:
+                self._client = None
+                self._algorithms = {}
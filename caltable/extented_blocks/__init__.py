@@ -1,2 +1,4 @@
 from .read_file import ReadFile
-from .read_sheet import ReadSheet
\ No newline at end of file
+from .read_sheet import ReadSheet
+from .load_sheet import LoadSheet
+from .scan_directory import ScanDirectory
\ No newline at end of file
@@ -0,0 +1,120 @@
+"""
+LoadSheet Class
+===============
+
+This module defines the `LoadSheet` class, a computational block for loading whole local sheet files
+(either `.csv` or `.xlsx` format) as a `DataTable`, one table row per sheet row. Sheets are parsed in
+chunks, and only the selected columns are parsed, so large sheets can drive a workflow directly.
+The block is registered with the `LocalCalBlockLib` for use in computational workflows.
+
+Class:
+------
+- `LoadSheet`: A computational block that loads the sheets listed in a table as a new table.
+
+Methods:
+--------
+- `__init__(self, columns=None, chunksize=100000, **kwargs)`: Initializes the `LoadSheet` block with optional
+  column selection and chunk size.
+- `forward(self, path)`: Loads the sheet file from the given path as a `DataTable`.
+- `forward_table(self, table)`: Loads the sheets of all rows of the table as one `DataTable`.
+"""
+
+from ..calblock import LocalCalBlockLib  # Import LocalCalBlockLib for registering computational blocks
+from ..calblock import CalBlock  # Import CalBlock as the base class for creating computational blocks
+from .._data_table import DataTable  # Import DataTable to hold the loaded rows
+from easyaccess.parameter import Parameter  # Import Parameter to define input/output parameters
+
+import itertools  # Import itertools to chain the chunks of several sheets
+import pathlib  # Import pathlib to handle file path operations
+
+@LocalCalBlockLib.register('load_sheet')
+class LoadSheet(CalBlock):
+    """
+    LoadSheet Class
+    ---------------
+    A computational block that loads whole sheet files (either `.csv` or `.xlsx`) as a table. Unlike
+    `ReadSheet`, which attaches one sheet row to each table row, this block replaces the input table
+    with the rows of the sheets it lists. The type of each column is mapped once from the pandas dtype of
+    the first chunk holding it.
+
+    Attributes:
+    -----------
+    columns (list or None): The columns to load, or None to load all columns.
+    chunksize (int): The number of sheet rows parsed at a time.
+    
+    Methods:
+    --------
+    forward(path): Loads the sheet file from the given path as a `DataTable`.
+    forward_table(table): Loads the sheets of all rows of the table as one `DataTable`.
+    """
+    
+    def __init__(self, columns=None, chunksize=100000, **kwargs):
+        """
+        Initializes the LoadSheet computational block with the given parameters.
+
+        Parameters:
+        -----------
+        columns (list or None): The columns to load. Other columns are not parsed. Defaults to all columns.
+        chunksize (int): The number of sheet rows parsed at a time; default is 100000.
+        kwargs: Additional keyword arguments passed to the parent `CalBlock` class for further customization.
+        """
+        self.columns = columns  # Set the selected columns
+        self.chunksize = chunksize  # Set the chunk size
+        super().__init__('Load Sheet',
+                         inputs={'path': Parameter.string('path', 'The path to the target sheet file (.csv or .xlsx)')},
+                         outputs={},
+                         desc='Load whole local sheet files as a table.',
+                         **kwargs)
+
+    def _frames(self, path):
+        """
+        Streams a sheet file as DataFrame chunks.
+
+        Parameters:
+        -----------
+        path (str): The path to the sheet file (either `.csv` or `.xlsx`).
+
+        Returns:
+        --------
+        iterable: The DataFrame chunks of the sheet.
+
+        Raises:
+        -------
+        TypeError: If the file extension is not supported (i.e., not `.csv` or `.xlsx`).
+        """
+        _suffix = pathlib.Path(path).suffix
+        if _suffix == '.csv':
+            import pandas as pd  # Import pandas for reading CSV files on first use
+            return pd.read_csv(path, usecols=self.columns, chunksize=self.chunksize)
+        elif _suffix == '.xlsx':
+            return DataTable._excel_frames(path, columns=self.columns, chunksize=self.chunksize)
+        raise TypeError(f'{_suffix} Not Supported!')  # Raise error for unsupported file types
+    
+    def forward(self, path):
+        """
+        Loads the sheet file from the specified path as a table.
+
+        Parameters:
+        -----------
+        path (str): The path to the sheet file (either `.csv` or `.xlsx`).
+
+        Returns:
+        --------
+        DataTable: The table holding the rows of the sheet.
+        """
+        return DataTable._from_frames(self._frames(path))
+
+    def forward_table(self, table):
+        """
+        Loads the sheets listed in the table as one table, in the order of the rows.
+
+        Parameters:
+        -----------
+        table (DataTable): The table holding the sheet paths.
+
+        Returns:
+        --------
+        DataTable: A new table holding the rows of all sheets.
+        """
+        _paths = [self._fetch_input(table, row=row, params=self.inputs)['path'] for row in range(len(table))]
+        return DataTable._from_frames(itertools.chain.from_iterable(self._frames(path) for path in _paths))
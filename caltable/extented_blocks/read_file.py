@@ -5,7 +5,8 @@ ReadFile Class
 This module defines the `ReadFile` class, a computational block for reading files from a local 
 system. It inherits from `CalBlock` and is registered with the `LocalCalBlockLib` for use in 
 computational workflows. The block reads the content of a specified file, either in binary or 
-text format, and outputs the file data and its name.
+text format, and outputs the file data and its name. In lazy mode, the block outputs a `FileHandle`
+instead, so the file is only read when a downstream block consumes it.
 
 Class:
 ------
@@ -13,8 +14,8 @@ Class:
 
 Methods:
 --------
-- `__init__(self, is_binary=False, encoding=None, **kwargs)`: Initializes the `ReadFile` block with 
-  optional parameters for binary reading and file encoding.
+- `__init__(self, is_binary=False, encoding=None, lazy=False, **kwargs)`: Initializes the `ReadFile` block with 
+  optional parameters for binary reading, file encoding, and lazy reading.
 - `forward(self, path)`: Reads the file from the specified path and returns the file's data 
   along with its name.
 """
@@ -22,6 +23,7 @@ Methods:
 from ..calblock import LocalCalBlockLib  # Import LocalCalBlockLib for registering computational blocks
 from ..calblock import CalBlock  # Import CalBlock as the base class for creating computational blocks
 from easyaccess.parameter import Parameter  # Import Parameter to define input/output parameters
+from ..type_engine import FileHandle  # Import FileHandle to reference files without reading them
 
 import pathlib  # Import pathlib to handle file path operations
 
@@ -37,13 +39,14 @@ class ReadFile(CalBlock):
     -----------
     is_binary (bool): A flag to determine whether to read the file in binary mode (default: False).
     encoding (str or None): The encoding to use when reading the file (default: None, i.e., system default).
+    lazy (bool): If True, the file is referenced by a `FileHandle` and read on use (default: False).
     
     Methods:
     --------
     forward(path): Reads the file from the given path and returns the file data and its name.
     """
     
-    def __init__(self, is_binary=False, encoding=None, **kwargs):
+    def __init__(self, is_binary=False, encoding=None, lazy=False, **kwargs):
         """
         Initializes the ReadFile computational block with the given parameters.
 
@@ -51,10 +54,13 @@ class ReadFile(CalBlock):
         -----------
         is_binary (bool): If True, the file is read in binary mode; default is False (text mode).
         encoding (str or None): The encoding to use when reading the file. If None, the default system encoding is used.
+        lazy (bool): If True, only the file size and modification time are read, and the file content is read
+            when a downstream block consumes it; default is False.
         kwargs: Additional keyword arguments passed to the parent `CalBlock` class for further customization.
         """
         self.is_binary = is_binary  # Set the binary flag
         self.encoding = encoding  # Set the encoding
+        self.lazy = lazy  # Set the lazy reading flag
         super().__init__('Read File',
                          inputs={'path': Parameter.string('path', 'The path to the target file')},
                          outputs={'file': Parameter.string('file', 'The file data'),
@@ -72,10 +78,13 @@ class ReadFile(CalBlock):
 
         Returns:
         --------
-        dict: A dictionary containing the 'filename' (file name without extension) and 'file' (file contents).
+        dict: A dictionary containing the 'filename' (file name without extension) and 'file' (file contents,
+        or a `FileHandle` in lazy mode).
         """
+        _name = pathlib.Path(path).stem  # Extract the file name without extension
+        if self.lazy:
+            return dict(filename=_name, file=FileHandle(path, binary=self.is_binary, encoding=self.encoding))
         _flag = 'rb' if self.is_binary else 'r'  # Determine the mode to open the file based on binary flag
         with open(path, _flag, encoding=self.encoding) as _file: 
             _data = _file.read()  # Read the file content
-        _name = pathlib.Path(path).stem  # Extract the file name without extension
         return dict(filename=_name, file=_data)  # Return the file name and content
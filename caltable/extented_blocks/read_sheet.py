@@ -6,23 +6,31 @@ This module defines the `ReadSheet` class, a computational block for reading dat
 file (either `.csv` or `.xlsx` format) and extracting a specific row of data based on the `row_index`. 
 The block is registered with the `LocalCalBlockLib` for use in computational workflows.
 
+Parsed sheets are cached by path, modification time, and size, up to `ReadSheet.cache_size` bytes, so a
+sheet shared by many rows is parsed once. In bulk mode, the block reads each sheet once per table and joins
+it onto all rows by `row_index` in one lookup.
+
 Class:
 ------
 - `ReadSheet`: A computational block that reads a specified row from a sheet file and returns it as a dictionary.
 
 Methods:
 --------
-- `__init__(self, **kwargs)`: Initializes the `ReadSheet` block with optional parameters.
+- `__init__(self, bulk=False, **kwargs)`: Initializes the `ReadSheet` block with optional parameters.
 - `forward(self, path, row_index)`: Reads the sheet file from the given path, extracts the row data specified by `row_index`, 
   and returns the data as a dictionary with non-null values.
+- `forward_table(self, table)`: Reads the rows of the whole table, joining each sheet at once in bulk mode.
+- `clear_cache()`: Drops all cached sheets.
 """
 
 from ..calblock import LocalCalBlockLib  # Import LocalCalBlockLib for registering computational blocks
 from ..calblock import CalBlock  # Import CalBlock as the base class for creating computational blocks
 from easyaccess.parameter import Parameter  # Import Parameter to define input/output parameters
 
+import os  # Import os to read the file size and modification time
 import pathlib  # Import pathlib to handle file path operations
-import pandas as pd  # Import pandas for reading sheet files (.csv and .xlsx)
+import threading  # Import threading to guard the shared sheet cache
+from collections import OrderedDict  # Import OrderedDict to evict the least recently used sheets
 
 @LocalCalBlockLib.register('read_sheet')
 class ReadSheet(CalBlock):
@@ -35,22 +43,33 @@ class ReadSheet(CalBlock):
 
     Attributes:
     -----------
-    None directly defined in this class (inherits from CalBlock).
+    bulk (bool): If True, `forward_table` joins each sheet onto all rows at once (default: False).
+    cache_size (int): The maximum memory in bytes of the parsed sheets kept in the cache, shared by all instances.
     
     Methods:
     --------
     forward(path, row_index): Reads the sheet from the given path, extracts the row identified by `row_index`, 
                                and returns the row data as a dictionary.
+    forward_table(table): Reads the rows of the whole table, joining each sheet at once in bulk mode.
+    clear_cache(): Drops all cached sheets.
     """
+
+    cache_size = 256 * 1024 * 1024
+    _cache = OrderedDict()
+    _cache_bytes = 0
+    _cache_lock = threading.Lock()
     
-    def __init__(self, **kwargs):
+    def __init__(self, bulk=False, **kwargs):
         """
         Initializes the ReadSheet computational block with the given parameters.
 
         Parameters:
         -----------
+        bulk (bool): If True, each sheet is read once per table and joined onto all rows by `row_index`
+            in one lookup; default is False.
         kwargs: Additional keyword arguments passed to the parent `CalBlock` class for further customization.
         """
+        self.bulk = bulk  # Set the bulk join flag
         super().__init__('Read File',
                          inputs={'path': Parameter.string('path', 'The path to the target sheet file (.csv or .xlsx)'),
                                  'row_index': Parameter.string('row_index', 'Select the target row', default_value='', optional=True)},
@@ -77,13 +96,89 @@ class ReadSheet(CalBlock):
         -------
         TypeError: If the file extension is not supported (i.e., not `.csv` or `.xlsx`).
         """
-        if pathlib.Path(path).suffix == '.csv':
-            _table = pd.read_csv(path, index_col=0)  # Read the CSV file
-        elif pathlib.Path(path).suffix == '.xlsx':
-            _table = pd.read_excel(path, index_col=0)  # Read the Excel file
-        else:
-            raise TypeError(f'{pathlib.Path(path).suffix} Not Supported!')  # Raise error for unsupported file types
-
+        _table = self._read_sheet(path)  # Read the sheet, or reuse the cached one
         _data = _table.loc[row_index].to_dict()  # Extract the specified row as a dictionary
         _data = {_k: _v for _k, _v in _data.items() if _v is not None}  # Remove any None values
         return _data  # Return the cleaned dictionary
+
+    def forward_table(self, table):
+        """
+        Reads the rows of the whole table. In bulk mode, the rows sharing a sheet are looked up in one
+        operation and assigned to the table in order.
+
+        Parameters:
+        -----------
+        table (DataTable): The data table to process.
+
+        Returns:
+        --------
+        DataTable: The updated table with the sheet columns attached.
+        """
+        if not self.bulk:
+            return super().forward_table(table)
+        _groups = {}  # Group the rows by the sheet they read from
+        for row in range(len(table)):
+            _inputs = self._fetch_input(table, row=row, params=self.inputs)
+            _groups.setdefault(_inputs['path'], []).append((row, _inputs.get('row_index', '')))
+        for path, _rows in _groups.items():
+            _table = self._read_sheet(path)
+            if not _table.index.is_unique:  # Duplicated labels select several rows, so look them up one by one
+                for row, row_index in _rows:
+                    self._assign_output(table, row=row, outputs=self.forward(path, row_index), params=self.outputs)
+                continue
+            _records = _table.loc[[row_index for _, row_index in _rows]].to_dict('records')  # Join all rows at once
+            for (row, _), _data in zip(_rows, _records):
+                _data = {_k: _v for _k, _v in _data.items() if _v is not None}  # Remove any None values
+                self._assign_output(table, row=row, outputs=_data, params=self.outputs)
+        return table
+
+    @classmethod
+    def _read_sheet(cls, path):
+        """
+        Reads a sheet file, reusing the parsed sheet while the file is unchanged.
+        The least recently used sheets are dropped when the cache exceeds `cache_size` bytes.
+
+        Parameters:
+        -----------
+        path (str): The path to the sheet file (either `.csv` or `.xlsx`).
+
+        Returns:
+        --------
+        pd.DataFrame: The parsed sheet, indexed by its first column. It is shared and must not be modified.
+
+        Raises:
+        -------
+        TypeError: If the file extension is not supported (i.e., not `.csv` or `.xlsx`).
+        """
+        import pandas as pd  # Import pandas for reading sheet files (.csv and .xlsx) on first use
+        _suffix = pathlib.Path(path).suffix
+        if _suffix not in ('.csv', '.xlsx'):
+            raise TypeError(f'{_suffix} Not Supported!')  # Raise error for unsupported file types
+        _stat = os.stat(path)
+        _key = (os.path.abspath(path), _stat.st_mtime, _stat.st_size)
+        with cls._cache_lock:
+            if _key in cls._cache:
+                cls._cache.move_to_end(_key)
+                return cls._cache[_key][0]
+        if _suffix == '.csv':
+            _table = pd.read_csv(path, index_col=0)  # Read the CSV file
+        else:
+            _table = pd.read_excel(path, index_col=0)  # Read the Excel file
+        _size = int(_table.memory_usage(deep=True).sum())
+        with cls._cache_lock:
+            if _key not in cls._cache and _size <= cls.cache_size:
+                cls._cache[_key] = (_table, _size)
+                cls._cache_bytes += _size
+                while cls._cache_bytes > cls.cache_size:
+                    _, (_, _evicted) = cls._cache.popitem(last=False)
+                    cls._cache_bytes -= _evicted
+        return _table
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drops all cached sheets.
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._cache_bytes = 0
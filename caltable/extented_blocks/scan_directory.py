@@ -0,0 +1,112 @@
+"""
+ScanDirectory Class
+===================
+
+This module defines the `ScanDirectory` class, a computational block for building a table of the files
+in local directories. Directories are walked in parallel, the path, size, and modification time of each
+file are collected in one pass, and file contents are optionally read by a bounded pool of threads.
+The block is registered with the `LocalCalBlockLib` for use in computational workflows.
+
+Class:
+------
+- `ScanDirectory`: A computational block that lists the files of the directories in a table as a new table.
+
+Methods:
+--------
+- `__init__(self, pattern='*', recursive=False, read=False, is_binary=False, encoding=None, workers=8, **kwargs)`:
+  Initializes the `ScanDirectory` block with the file pattern and reading options.
+- `forward(self, path)`: Lists the files of the directory at the given path as a `DataTable`.
+- `forward_table(self, table)`: Lists the files of the directories of all rows of the table as one `DataTable`.
+"""
+
+from ..calblock import LocalCalBlockLib  # Import LocalCalBlockLib for registering computational blocks
+from ..calblock import CalBlock  # Import CalBlock as the base class for creating computational blocks
+from .._data_table import DataTable  # Import DataTable to hold the listed files
+from easyaccess.parameter import Parameter  # Import Parameter to define input/output parameters
+
+@LocalCalBlockLib.register('scan_directory')
+class ScanDirectory(CalBlock):
+    """
+    ScanDirectory Class
+    -------------------
+    A computational block that lists the files of local directories. The input table holds the
+    directories in its `path` column, and the output table holds one row per matching file with its
+    `path`, `filename`, `size`, `mtime`, and optionally its contents in `file`.
+
+    Attributes:
+    -----------
+    pattern (str): The shell-style pattern the file names must match.
+    recursive (bool): If True, subdirectories are scanned too.
+    read (bool or str): If True, file contents are read; if 'lazy', they are referenced by `FileHandle`.
+    is_binary (bool): If True, files are read in binary mode.
+    encoding (str or None): The encoding to use when reading text files.
+    workers (int): The number of threads scanning directories and reading files.
+    
+    Methods:
+    --------
+    forward(path): Lists the files of the directory at the given path as a `DataTable`.
+    forward_table(table): Lists the files of the directories of all rows of the table as one `DataTable`.
+    """
+    
+    def __init__(self, pattern='*', recursive=False, read=False, is_binary=False, encoding=None, workers=8, **kwargs):
+        """
+        Initializes the ScanDirectory computational block with the given parameters.
+
+        Parameters:
+        -----------
+        pattern (str): The shell-style pattern the file names must match, such as '*.pdb'; default is all files.
+        recursive (bool): If True, subdirectories are scanned too; default is False.
+        read (bool or str): If True, file contents are read into the `file` column; if 'lazy', the column holds
+            a `FileHandle` read on use; default is False (no `file` column).
+        is_binary (bool): If True, files are read in binary mode; default is False (text mode).
+        encoding (str or None): The encoding to use when reading text files. If None, the default system encoding is used.
+        workers (int): The number of threads scanning directories and reading files; default is 8.
+        kwargs: Additional keyword arguments passed to the parent `CalBlock` class for further customization.
+        """
+        self.pattern = pattern  # Set the file name pattern
+        self.recursive = recursive  # Set the recursive scan flag
+        self.read = read  # Set the reading mode
+        self.is_binary = is_binary  # Set the binary flag
+        self.encoding = encoding  # Set the encoding
+        self.workers = workers  # Set the number of threads
+        super().__init__('Scan Directory',
+                         inputs={'path': Parameter.string('path', 'The path to the target directory')},
+                         outputs={},
+                         desc='List the files of local directories as a table.',
+                         **kwargs)
+    
+    def forward(self, path):
+        """
+        Lists the files of the directory at the specified path.
+
+        Parameters:
+        -----------
+        path (str): The path to the directory.
+
+        Returns:
+        --------
+        DataTable: The table of the files, sorted by path.
+        """
+        return DataTable.from_directory(path, pattern=self.pattern, recursive=self.recursive, read=self.read,
+                                        binary=self.is_binary, encoding=self.encoding, workers=self.workers)
+
+    def forward_table(self, table):
+        """
+        Lists the files of the directories listed in the table as one table, in the order of the rows.
+
+        Parameters:
+        -----------
+        table (DataTable): The table holding the directory paths.
+
+        Returns:
+        --------
+        DataTable: A new table holding the files of all directories.
+        """
+        _result = None
+        for row in range(len(table)):
+            _table = self.forward(**self._fetch_input(table, row=row, params=self.inputs))
+            if _result is None:
+                _result = _table
+            else:
+                _result._table.extend(_table._table)
+        return DataTable() if _result is None else _result
@@ -9,6 +9,8 @@ Imports:
 - NumberTypeEngine, StringTypeEngine, NumArrayTypeEngine: Specialized type engines for handling specific types of data.
 - StringTableTypeEngine, StringJSONTypeEngine: Rich engines for rendering string-based tables and formatted JSON data.
 - FileUnit: A utility for saving and working with data files.
+- BlobStore, BlobHandle: A content-addressed store that large values are spilled to, and the handles referring to them.
+- FileHandle: A handle referring to a local file that is read on demand.
 """
 
 from ._type_engine import TypeEngine
@@ -17,4 +19,7 @@ from ._meta_engines import StringTypeEngine
 from ._meta_engines import NumArrayTypeEngine
 from ._rich_engines import StringTableTypeEngine
 from ._rich_engines import StringJSONTypeEngine
-from ._file import FileUnit
\ No newline at end of file
+from ._file import FileUnit
+from ._blob import BlobStore
+from ._blob import BlobHandle
+from ._blob import FileHandle
@@ -0,0 +1,315 @@
+"""
+BlobStore Class Module
+======================
+
+This module provides the `BlobStore` class, a content-addressed directory that large string and binary
+values are spilled to, and the `BlobHandle` class that type engines hold in place of a spilled value.
+Values are written once under the SHA-256 of their content, so identical values share one file, and
+they are only read back (or memory-mapped) when they are accessed.
+
+`FileHandle` shares the handle interface for files that already exist on disk, so they can be
+referenced by a table without being read.
+
+The store is disabled by default. It is enabled by setting `CALTABLE_BLOB_DIR` (and optionally
+`CALTABLE_BLOB_THRESHOLD`, in bytes) or by calling `BlobStore.configure`.
+
+Author: Jiarui Li
+Email: jli78@tulane.edu
+Affiliation: Computer Science Department, Tulane University
+"""
+
+import os
+import mmap
+import shutil
+import hashlib
+import tempfile
+
+
+class BlobHandle(object):
+    """
+    A reference to a value stored in a file, read on demand.
+
+    Attributes:
+        path (str): The path of the file holding the value.
+        size (int): The size of the file in bytes.
+        binary (bool): If True, the value is bytes, otherwise it is text.
+        encoding (str): The encoding of a text value.
+    """
+
+    _newline = ''  # Text values are read back exactly as they were stored
+
+    def __init__(self, path, size=None, binary=True, encoding='utf-8', length=None):
+        """
+        Initializes a BlobHandle instance.
+
+        Args:
+            path (str): The path of the file holding the value.
+            size (int, optional): The size of the file in bytes. Defaults to the current file size.
+            binary (bool, optional): If True, the value is bytes, otherwise it is text. Defaults to True.
+            encoding (str, optional): The encoding of a text value. Defaults to 'utf-8'.
+            length (int, optional): The length of the value in characters, if already known.
+        """
+        self.path = str(path)
+        self.size = os.path.getsize(self.path) if size is None else size
+        self.binary = binary
+        self.encoding = encoding
+        self._length = length
+
+    def __repr__(self):
+        """
+        Returns a string representation of the handle.
+
+        Returns:
+            str: The string representation, showing the path and size.
+        """
+        return f'<{"Binary" if self.binary else "Text"} Blob {self.path} ({self.size} Bytes)>'
+
+    def __len__(self):
+        """
+        Returns the length of the value, in bytes for binary values and characters for text values.
+
+        Returns:
+            int: The length of the value.
+        """
+        return self.length
+
+    @property
+    def length(self):
+        """
+        The length of the value, in bytes for binary values and characters for text values.
+        The text is read once to count its characters, unless the length is already known.
+
+        Returns:
+            int: The length of the value.
+        """
+        if self.binary:
+            return self.size
+        if self._length is None:
+            self._length = len(self.read())
+        return self._length
+
+    def read(self):
+        """
+        Reads the whole value from the file.
+
+        Returns:
+            bytes or str: The value.
+        """
+        if self.binary:
+            with open(self.path, 'rb') as f:
+                return f.read()
+        with open(self.path, 'r', encoding=self.encoding, newline=self._newline) as f:
+            return f.read()
+
+    def head(self, n):
+        """
+        Reads the beginning of the value without loading the rest.
+
+        Args:
+            n (int): The number of bytes or characters to read.
+
+        Returns:
+            bytes or str: The first `n` bytes or characters of the value.
+        """
+        if self.binary:
+            with open(self.path, 'rb') as f:
+                return f.read(n)
+        with open(self.path, 'r', encoding=self.encoding, newline=self._newline) as f:
+            return f.read(n)
+
+    def mmap(self):
+        """
+        Memory-maps the file read-only.
+
+        Returns:
+            mmap.mmap: The memory map of the file.
+        """
+        with open(self.path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def copy(self, path):
+        """
+        Copies the file to a new path without loading it into memory.
+
+        Args:
+            path (str): The destination path.
+
+        Returns:
+            str: The destination path.
+        """
+        shutil.copyfile(self.path, path)
+        return path
+
+
+class BlobStore(object):
+    """
+    A content-addressed directory holding values larger than a size threshold.
+
+    Attributes:
+        path (str or None): The directory of the store. None disables spilling.
+        threshold (int): The size in bytes from which values are spilled.
+    """
+
+    _default = None
+
+    def __init__(self, path=None, threshold=1 << 20):
+        """
+        Initializes a BlobStore instance.
+
+        Args:
+            path (str, optional): The directory of the store. None disables spilling.
+            threshold (int, optional): The size in bytes from which values are spilled. Defaults to 1 MB.
+        """
+        self.path = None if path is None else str(path)
+        self.threshold = int(threshold)
+
+    def __repr__(self):
+        """
+        Returns a string representation of the store.
+
+        Returns:
+            str: The string representation, showing the directory and threshold.
+        """
+        return f'<BlobStore {self.path} (>= {self.threshold} Bytes)>'
+
+    @classmethod
+    def default(cls):
+        """
+        Returns the store used by the type engines, created from the environment on first use.
+
+        Returns:
+            BlobStore: The default store.
+        """
+        if cls._default is None:
+            cls._default = cls(path=os.environ.get('CALTABLE_BLOB_DIR'),
+                               threshold=os.environ.get('CALTABLE_BLOB_THRESHOLD', 1 << 20))
+        return cls._default
+
+    @classmethod
+    def configure(cls, path, threshold=1 << 20):
+        """
+        Sets the store used by the type engines.
+
+        Args:
+            path (str): The directory of the store. None disables spilling.
+            threshold (int, optional): The size in bytes from which values are spilled. Defaults to 1 MB.
+
+        Returns:
+            BlobStore: The new default store.
+        """
+        cls._default = cls(path=path, threshold=threshold)
+        return cls._default
+
+    def put(self, value):
+        """
+        Writes a value to the store, unless the same content is already stored.
+
+        Args:
+            value (bytes or str): The value to store. Text is stored as UTF-8.
+
+        Returns:
+            BlobHandle: The handle of the stored value.
+        """
+        _binary = isinstance(value, (bytes, bytearray, memoryview))
+        _data = bytes(value) if _binary else value.encode('utf-8')
+        _digest = hashlib.sha256(_data).hexdigest()
+        _dir = os.path.join(self.path, _digest[:2])
+        _path = os.path.join(_dir, _digest[2:])
+        if not os.path.isfile(_path):
+            os.makedirs(_dir, exist_ok=True)
+            _fd, _tmp = tempfile.mkstemp(dir=_dir, suffix='.tmp')
+            with os.fdopen(_fd, 'wb') as f:
+                f.write(_data)
+            os.replace(_tmp, _path)
+        return BlobHandle(_path, size=len(_data), binary=_binary,
+                          length=None if _binary else len(value))
+
+    def spill(self, value):
+        """
+        Stores a value if spilling is enabled and the value is a string or bytes above the threshold.
+        The threshold applies to the size in bytes, so text is measured in UTF-8.
+
+        Args:
+            value: The value to store.
+
+        Returns:
+            BlobHandle or object: The handle of the stored value, or the value itself if it is kept in memory.
+        """
+        if self.path is None or not isinstance(value, (str, bytes)):
+            return value
+        if isinstance(value, str) and len(value) < self.threshold:
+            if len(value) * 4 < self.threshold:  # UTF-8 takes at most 4 bytes per character
+                return value
+            if len(value.encode('utf-8')) < self.threshold:
+                return value
+        elif len(value) < self.threshold:
+            return value
+        return self.put(value)
+
+
+class FileHandle(BlobHandle):
+    """
+    A reference to a local file, read on demand instead of being loaded when it is referenced.
+
+    Attributes:
+        path (str): The path of the file.
+        size (int): The size of the file in bytes when the handle was created.
+        mtime (float): The modification time of the file when the handle was created.
+        binary (bool): If True, the file is read as bytes, otherwise as text.
+        encoding (str or None): The encoding of a text file. None uses the system default.
+    """
+
+    _newline = None  # Text files are read with universal newlines, as `open` does by default
+
+    def __init__(self, path, binary=False, encoding=None):
+        """
+        Initializes a FileHandle instance from the current state of the file.
+
+        Args:
+            path (str): The path of the file.
+            binary (bool, optional): If True, the file is read as bytes, otherwise as text. Defaults to False.
+            encoding (str, optional): The encoding of a text file. Defaults to the system default.
+        """
+        _stat = os.stat(path)
+        super().__init__(path, size=_stat.st_size, binary=binary, encoding=encoding)
+        self.mtime = _stat.st_mtime
+
+    def __repr__(self):
+        """
+        Returns a string representation of the handle.
+
+        Returns:
+            str: The string representation, showing the path and size.
+        """
+        return f'<{"Binary" if self.binary else "Text"} File {self.path} ({self.size} Bytes)>'
+
+    def __len__(self):
+        """
+        Returns the size of the file in bytes, so that the file is not read to count its characters.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return self.size
+
+    @property
+    def length(self):
+        """
+        The size of the file in bytes. Text files are not read to count their characters, so that previews
+        of lazily read files stay lazy.
+
+        Returns:
+            int: The size of the file in bytes.
+        """
+        return self.size
+
+    @property
+    def modified(self):
+        """
+        Whether the file changed since the handle was created.
+
+        Returns:
+            bool: True if the size or modification time of the file changed.
+        """
+        _stat = os.stat(self.path)
+        return _stat.st_size != self.size or _stat.st_mtime != self.mtime
@@ -14,11 +14,14 @@ from uuid import uuid4
 from pathlib import Path
 import os
 import io
+import shutil
+from ._blob import BlobHandle
 
 class FileUnit(object):
     """
     Represents a file, either binary or text, with methods to handle file operations
-    like saving to disk and writing to a buffer.
+    like saving to disk and writing to a buffer. The data may also be a `BlobHandle`, which is copied
+    from its file without being loaded.
 
     Attributes:
         data: The file's data (either bytes or string).
@@ -32,14 +35,18 @@ class FileUnit(object):
         Initializes the FileUnit instance.
 
         Args:
-            data (bytes or str): The content of the file.
+            data (bytes, str, or BlobHandle): The content of the file.
             name (str, optional): The name of the file. Defaults to a random UUID if not provided.
             ext (str, optional): The extension of the file. Defaults to 'txt'.
         """
-        self.binary_file = isinstance(data, bytes)
-        if self.binary_file:
+        if isinstance(data, BlobHandle):
+            self.binary_file = data.binary
+            self.data = data
+        elif isinstance(data, bytes):
+            self.binary_file = True
             self.data = data
         else:
+            self.binary_file = False
             self.data = str(data)
         self.name = str(uuid4()) if name is None else name
         self.ext = ext
@@ -51,6 +58,8 @@ class FileUnit(object):
         Returns:
             int: The length of the file data in bytes.
         """
+        if isinstance(self.data, BlobHandle):
+            return self.data.size
         if self.binary_file:
             return len(self.data)
         else:
@@ -94,6 +103,8 @@ class FileUnit(object):
             Path: The path to the saved file.
         """
         _path = os.path.join(path, f'{prefix}{self.name}.{self.ext}')
+        if isinstance(self.data, BlobHandle):
+            return Path(self.data.copy(_path))
         _mode = 'wb' if self.binary_file else 'w'
         with open(_path, _mode) as f_handle_:
             f_handle_.write(self.data)
@@ -109,6 +120,10 @@ class FileUnit(object):
         Returns:
             io.BytesIO: The buffer containing the file's data.
         """
+        if isinstance(self.data, BlobHandle):
+            with open(self.data.path, 'rb') as f_handle_:
+                shutil.copyfileobj(f_handle_, buffer)
+            return buffer
         buffer.write(self.data)
         return buffer
 
@@ -13,9 +13,11 @@ Affiliation: Computer Science Department, Tulane University
 """
 
 from ._type_engine import TypeEngine
-import plotly.express as px
-import pandas as pd
+from ._file import FileUnit
+from ._blob import BlobHandle
+import numpy as np
 import math
+import io
 
 class _MetaTypeEngine(TypeEngine):
     """
@@ -25,6 +27,7 @@ class _MetaTypeEngine(TypeEngine):
     Attributes:
         _iotype_meta_id (str): A unique identifier for the engine's metadata type.
     """
+    __slots__ = ()
     _iotype_meta_id = ''
 
 
@@ -95,6 +98,7 @@ class StringTypeEngine(_MetaTypeEngine):
     Attributes:
         preview (str): A preview of the string, truncated if too long.
     """
+    __slots__ = ()
     _iotype_meta_id = 'string'
 
     @property
@@ -102,13 +106,23 @@ class StringTypeEngine(_MetaTypeEngine):
         """
         Provides a preview of the string value.
 
+        The length is taken from the string itself, not from `len(self)`, which subclasses may redefine
+        (such as the row count of a table), so that the preview does not parse the value.
+
         Returns:
             str: The preview, truncated if the string length exceeds 16 characters.
         """
-        if len(self.value) > 16:
-            return f'{self.iotype.name}:{self.value[:16]}...({len(self.value)})'
+        if self.handle is not None:
+            _head = self.handle.head(17)
+        elif isinstance(self.value, (str, bytes)):
+            _head = self.value[:17]
+        else:
+            return f'{self.value}'  # Values that are not text, such as numbers, are shown whole
+        if len(_head) > 16:
+            _length = len(self.value) if self.handle is None else self.handle.length
+            return f'{self.iotype.name}:{_head[:16]}...({_length})'
         else:
-            return f'{self.value}'
+            return f'{_head}'  # The head is the whole value, so a handle is not read again
 
 
 @_MetaEngineLibs.register
@@ -119,6 +133,7 @@ class NumberTypeEngine(_MetaTypeEngine):
     Attributes:
         preview (str): The string representation of the numeric value.
     """
+    __slots__ = ()
     _iotype_meta_id = 'number'
 
     def __len__(self):
@@ -145,23 +160,73 @@ class NumberTypeEngine(_MetaTypeEngine):
 class NumArrayTypeEngine(_MetaTypeEngine):
     """
     A type engine for numeric array values, which allows for plotting and visualization.
+    Values are stored as one-dimensional NumPy arrays of `dtype`. Comparisons and arithmetic are
+    elementwise and return NumPy arrays. Plots of arrays longer than `max_plot_points` are
+    downsampled by min/max binning, unless the full resolution is requested.
 
     Attributes:
+        dtype: The NumPy dtype of the stored arrays (default is float64).
+        max_plot_points (int): The maximum number of points plotted by default (default is 2000).
         preview (str): A preview of the numeric array, truncated if too long.
     """
+    __slots__ = ()
     _iotype_meta_id = 'numarray'
+    dtype = np.float64
+    max_plot_points = 2000
     
-    def __init__(self, value, iotype):
+    def __init__(self, value, iotype, dtype=None):
+        """
+        Initializes the NumArrayTypeEngine, parsing comma, newline, or space separated strings.
+
+        Args:
+            value: The numeric array, or its string representation.
+            iotype: The type of the value, providing metadata.
+            dtype (optional): The NumPy dtype of the array, such as float32. Defaults to `dtype`.
+        """
+        dtype = self.dtype if dtype is None else dtype
+        if isinstance(value, BlobHandle):
+            value = value.read()
+        if isinstance(value, bytes):
+            value = value.decode()
         if isinstance(value, str):
-            try: value = [float(value)]
-            except:
-                try:
-                    if ',' in value: value = [float(i) for i in value.split(',') if len(i) > 0]
-                    elif '\n' in value: value = [float(i) for i in value.split('\n') if len(i) > 0]
-                    else: value = [float(i) for i in value.split(' ') if len(i) > 0]
-                except: value = [math.nan]
+            try: value = np.array(value.replace(',', ' ').split(), dtype=dtype)
+            except ValueError: value = np.array([math.nan], dtype=dtype)
+        else:
+            try: value = np.atleast_1d(np.asarray(value, dtype=dtype))
+            except (TypeError, ValueError): pass
         super().__init__(value, iotype)
 
+    def _binary_opt(self, other, func):
+        """
+        Applies a binary operation elementwise, broadcasting scalars and arrays of other engines.
+
+        Args:
+            other: The other object to operate on.
+            func: The binary operation function to apply.
+
+        Returns:
+            numpy.ndarray: The elementwise result.
+        """
+        if isinstance(other, TypeEngine):
+            other = other.value
+        if isinstance(other, (list, tuple)):
+            other = np.asarray(other)
+        return func(np.asarray(self.value), other)
+
+    def __contains__(self, other):
+        """
+        Checks if the array contains a value.
+
+        Args:
+            other: The value to check for containment.
+
+        Returns:
+            bool: `True` if any element equals the value, `False` otherwise.
+        """
+        if isinstance(other, TypeEngine):
+            other = other.value
+        return bool(np.any(np.asarray(self.value) == other))
+
     @property
     def preview(self):
         """
@@ -171,21 +236,50 @@ class NumArrayTypeEngine(_MetaTypeEngine):
             str: The preview, truncated if the array length exceeds 3 elements.
         """
         if len(self.value) > 3:
-            return f'{self.iotype.name}:{self.value[:3]}...({len(self.value)})'
+            return f'{self.iotype.name}:{np.asarray(self.value[:3]).tolist()}...({len(self.value)})'
         else:
-            return f'{self.value}'
+            return f'{np.asarray(self.value).tolist()}'
+
+    @staticmethod
+    def _downsample(value, max_points):
+        """
+        Downsamples an array by min/max binning: the array is split into `max_points / 2` bins, and the
+        minimum and maximum of each bin are kept, so peaks survive the reduction.
+
+        Args:
+            value: The numeric array.
+            max_points (int or None): The maximum number of points to keep. None keeps all points.
 
-    def _plot(self, value):
+        Returns:
+            tuple: The indices of the kept points and their values.
+        """
+        _value = np.asarray(value)
+        _length = len(_value)
+        if max_points is None or _length <= max_points:
+            return np.arange(_length), _value
+        _bins = max(1, max_points // 2)
+        _size = -(-_length // _bins)
+        _padded = np.concatenate([_value, np.repeat(_value[-1:], _size * _bins - _length)]).reshape(_bins, _size)
+        _offsets = np.arange(_bins) * _size
+        _index = np.concatenate([_offsets + _padded.argmin(axis=1), _offsets + _padded.argmax(axis=1)])
+        _index = np.unique(np.minimum(_index, _length - 1))
+        return _index, _value[_index]
+
+    def _plot(self, value, full=False):
         """
         Creates a plotly line plot for the given numeric array.
 
         Args:
             value: The numeric array to plot.
+            full (bool, optional): If True, all points are plotted. Otherwise arrays longer than
+                `max_plot_points` are downsampled. Defaults to False.
 
         Returns:
             plotly.graph_objects.Figure: A Plotly figure representing the line plot.
         """
-        fig = px.line(x=list(range(len(value))), y=value, title=self.iotype.name)
+        import plotly.express as px
+        _x, _y = self._downsample(value, None if full else self.max_plot_points)
+        fig = px.line(x=_x, y=_y, title=self.iotype.name)
         return fig
 
     def _repr_markdown_(self):
@@ -195,17 +289,50 @@ class NumArrayTypeEngine(_MetaTypeEngine):
         Returns:
             str: The markdown representation, including the plot and HTML table.
         """
+        import pandas as pd
         self._plot(self.value).show()
         return f'{pd.DataFrame(self.value).T._repr_html_()}'
 
-    def view_html(self, **kwargs):
+    def view_html(self, full=False, include_plotlyjs=True, cache=True, **kwargs):
         """
-        Returns an HTML representation of the numeric array as a Plotly plot.
+        Returns an HTML representation of the numeric array as a Plotly plot. The HTML is cached on the engine.
 
         Args:
+            full (bool, optional): If True, all points are plotted instead of a downsampled array. Defaults to False.
+            include_plotlyjs (bool or str, optional): If True, a full HTML page embedding the Plotly runtime is returned.
+                If False, only the figure div is returned, and the page must load the runtime once. Other values are
+                passed to `Figure.to_html`. Defaults to True.
+            cache (bool, optional): If False, newly rendered HTML is not kept in the cache. Defaults to True.
             **kwargs: Additional keyword arguments for customizing the plot.
 
         Returns:
             str: The HTML representation of the plot.
         """
-        return self._plot(self.value).to_html()
+        _key = (full, include_plotlyjs)
+        if not cache:
+            return (self._html_cache or {}).get(_key) or self._plot(self.value, full=full).to_html(
+                include_plotlyjs=include_plotlyjs, full_html=include_plotlyjs is True)
+        if self._html_cache is None:
+            self._html_cache = {}
+        if _key not in self._html_cache:
+            self._html_cache[_key] = self._plot(self.value, full=full).to_html(
+                include_plotlyjs=include_plotlyjs, full_html=include_plotlyjs is True)
+        return self._html_cache[_key]
+
+    def file(self, name=None, ext='txt'):
+        """
+        Converts the numeric array into a `FileUnit` object.
+
+        Args:
+            name (str, optional): The name of the file. Defaults to a randomly generated UUID if not provided.
+            ext (str, optional): The file extension. `npy` writes a binary NumPy file, others write text.
+                Defaults to 'txt'.
+
+        Returns:
+            FileUnit: A `FileUnit` object representing the array as a file.
+        """
+        if ext == 'npy':
+            _buffer = io.BytesIO()
+            np.save(_buffer, np.asarray(self.value))
+            return FileUnit(data=_buffer.getvalue(), name=name, ext=ext)
+        return FileUnit(data=str(np.asarray(self.value).tolist()), name=name, ext=ext)
@@ -13,25 +13,85 @@ Affiliation: Computer Science Department, Tulane University
 
 import re
 import json
-import pandas as pd
-from tabulate import tabulate
+import functools
+from itertools import zip_longest
+import numpy as np
 from .._data_unit import DataUnit
 from ._meta_engines import StringTypeEngine
 from ._file import FileUnit
+from ._blob import BlobHandle
+
+try:
+    import orjson as _fast_json  # Optional faster JSON backend
+except ImportError:
+    _fast_json = None
+
+
+def _json_loads(value):
+    """
+    Parses a JSON string, using the faster backend when it is installed.
+
+    Args:
+        value (str or bytes): The JSON string.
+
+    Returns:
+        The parsed JSON object.
+    """
+    if _fast_json is not None:
+        try: return _fast_json.loads(value)
+        except _fast_json.JSONDecodeError: pass
+    return json.loads(value)
+
+
+def _json_dumps(obj, indent=None):
+    """
+    Serializes an object to a JSON string, compact unless an indentation is given.
+
+    Args:
+        obj: The JSON object.
+        indent (int, optional): The indentation for pretty printing. Defaults to compact output.
+
+    Returns:
+        str: The JSON string.
+    """
+    if indent is None:
+        if _fast_json is not None:
+            try: return _fast_json.dumps(obj).decode()
+            except TypeError: pass
+        return json.dumps(obj, separators=(',', ':'))
+    return json.dumps(obj, indent=indent)
+
+
+@functools.lru_cache(maxsize=None)
+def _table_patterns(sep, end):
+    """
+    Compiles the separator and line-ending patterns of a table configuration once.
+
+    Args:
+        sep (str): The column separator pattern.
+        end (str): The line-ending pattern.
+
+    Returns:
+        tuple: The compiled separator and line-ending patterns.
+    """
+    return re.compile(sep), re.compile(end)
 
 
 class StringTableTypeEngine(StringTypeEngine):
     """
     A type engine for handling string-based tables. This class formats a string value as a table, splitting it based
-    on a specified separator and line ending.
+    on a specified separator and line ending. The string is only parsed when the table is first needed.
 
     Attributes:
         sep (str): The separator used to split the string into table columns (default is a space).
         end (str): The line ending used to split the string into rows (default is a newline).
+        typed (bool): If True, numeric columns are parsed into typed NumPy arrays (default is False).
         table_value (list): The parsed table as a list of rows and columns.
+        columns (list): The parsed table as a list of columns.
     """
+    __slots__ = ('sep', 'end', 'typed', '_table', '_columns')
     
-    def __init__(self, value, iotype, sep=' ', end='\n'):
+    def __init__(self, value, iotype, sep=' ', end='\n', typed=False):
         """
         Initializes the StringTableTypeEngine with the string value, iotype, separator, and line-ending characters.
 
@@ -40,10 +100,55 @@ class StringTableTypeEngine(StringTypeEngine):
             iotype: The type of the value, used for metadata.
             sep (str): The separator to use between columns (default is space).
             end (str): The line-ending character (default is newline).
+            typed (bool): If True, numeric columns are parsed into typed NumPy arrays (default is False).
         """
         super().__init__(value=value, iotype=iotype)
-        self.sep, self.end = sep, end
-        self.table_value = self._build_table(value, sep=sep, end=end)
+        self.sep, self.end, self.typed = sep, end, typed
+        self._table, self._columns = None, None
+    
+    @property
+    def table_value(self):
+        """
+        The parsed table as a list of rows, parsed on first access.
+
+        Returns:
+            list: The parsed table as a list of rows, each containing columns.
+        """
+        if self._table is None:
+            self._table = self._build_table(self.value, sep=self.sep, end=self.end)
+        return self._table
+    
+    @property
+    def columns(self):
+        """
+        The parsed table as a list of columns, parsed on first access. Missing cells of short rows are empty strings.
+        If `typed` is True, columns holding only integers or floats are NumPy arrays.
+
+        Returns:
+            list: The columns of the table.
+        """
+        if self._columns is None:
+            _columns = [list(_column) for _column in zip_longest(*self.table_value, fillvalue='')]
+            if self.typed:
+                _columns = [self._typed_column(_column) for _column in _columns]
+            self._columns = _columns
+        return self._columns
+    
+    @staticmethod
+    def _typed_column(column):
+        """
+        Converts a column of strings into an integer or float NumPy array when possible.
+
+        Args:
+            column (list): The column of strings.
+
+        Returns:
+            numpy.ndarray or list: The typed column, or the original column if it is not numeric.
+        """
+        for _dtype in (np.int64, np.float64):
+            try: return np.array(column).astype(_dtype)
+            except (ValueError, OverflowError): pass
+        return column
     
     def _build_table(self, value, sep=' ', end='\n'):
         """
@@ -57,7 +162,8 @@ class StringTableTypeEngine(StringTypeEngine):
         Returns:
             list: The parsed table as a list of rows, each containing columns.
         """
-        return [re.split(sep, line) for line in re.split(end, value) if len(line) > 0]
+        _sep, _end = _table_patterns(sep, end)
+        return [_sep.split(line) for line in _end.split(value) if len(line) > 0]
     
     def __len__(self):
         """
@@ -75,6 +181,7 @@ class StringTableTypeEngine(StringTypeEngine):
         Returns:
             str: The tabulated string representation of the table.
         """
+        from tabulate import tabulate
         return tabulate(self.table_value)
     
     def _repr_markdown_(self):
@@ -84,28 +191,41 @@ class StringTableTypeEngine(StringTypeEngine):
         Returns:
             str: The HTML representation of the table.
         """
+        import pandas as pd
+        if self.typed:
+            return pd.DataFrame(dict(enumerate(self.columns)))._repr_html_()
         return pd.DataFrame(self.table_value)._repr_html_()
 
 
 @DataUnit.register(['json'])
 class StringJSONTypeEngine(StringTypeEngine):
     """
-    A type engine for handling JSON strings. It parses the string as a JSON object, formats it for readability,
-    and allows for rendering the JSON as HTML.
+    A type engine for handling JSON strings. It parses the string once, keeps the original compact string,
+    and formats it with indentation only when it is displayed or exported.
 
     Attributes:
-        value (str): The JSON string value, formatted with indentation for readability.
+        value (str): The JSON string value as given.
+        parsed: The parsed JSON object.
     """
+    __slots__ = ('parsed',)
     
     def __init__(self, value, iotype):
         """
-        Initializes the StringJSONTypeEngine by parsing and formatting the JSON string.
+        Initializes the StringJSONTypeEngine by parsing the JSON string.
 
         Args:
-            value (str): The JSON string to process.
+            value (str or object): The JSON string to process, a handle to it, or an already parsed JSON object.
             iotype: The type of the value, used for metadata.
         """
-        super().__init__(value=json.dumps(json.loads(value), indent=2), iotype=iotype)
+        if isinstance(value, BlobHandle):
+            _parsed = _json_loads(value.read())
+        elif isinstance(value, (str, bytes)):
+            _parsed = _json_loads(value)
+            if isinstance(value, bytes): value = value.decode()
+        else:
+            _parsed, value = value, _json_dumps(value)
+        super().__init__(value=value, iotype=iotype)
+        self.parsed = _parsed
     
     def _template_fold(self, title, data):
         """
@@ -167,9 +287,9 @@ class StringJSONTypeEngine(StringTypeEngine):
         Provides a string representation of the JSON.
 
         Returns:
-            str: The formatted JSON string.
+            str: The JSON string formatted with indentation.
         """
-        return self.value
+        return _json_dumps(self.parsed, indent=2)
     
     def _repr_markdown_(self):
         """
@@ -178,7 +298,7 @@ class StringJSONTypeEngine(StringTypeEngine):
         Returns:
             str: The HTML representation of the JSON for markdown.
         """
-        return self._render_json(json.loads(self.value))
+        return self._render_json(self.parsed)
     
     def view_html(self, **kwargs):
         """
@@ -190,11 +310,11 @@ class StringJSONTypeEngine(StringTypeEngine):
         Returns:
             str: The HTML representation of the JSON.
         """
-        return self._render_json(json.loads(self.value))
+        return self._render_json(self.parsed)
     
     def file(self, name=None, ext='json'):
         """
-        Saves the JSON data as a file.
+        Saves the JSON data as a file, formatted with indentation.
 
         Args:
             name (str): The name of the file (default is None).
@@ -203,4 +323,4 @@ class StringJSONTypeEngine(StringTypeEngine):
         Returns:
             FileUnit: A FileUnit object containing the JSON data.
         """
-        return FileUnit(data=self.value, name=name, ext=ext)
+        return FileUnit(data=_json_dumps(self.parsed, indent=2), name=name, ext=ext)
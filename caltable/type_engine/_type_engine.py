@@ -3,7 +3,7 @@ TypeEngine Class Module
 ========================
 
 This module provides the `TypeEngine` class that handles the manipulation of values and their types
-with support for various operations (e.g., comparison, length checking) and provides integration
+with support for various operations (e.g., comparison, arithmetic, length checking) and provides integration
 with the `FileUnit` class to save or represent data as files.
 
 Author: Jiarui Li  
@@ -12,17 +12,27 @@ Affiliation: Computer Science Department, Tulane University
 """
 
 from ._file import FileUnit
+from ._blob import BlobStore, BlobHandle
 
 class TypeEngine(object):
     """
     A class that represents a value associated with a specific data type, and supports various operations
-    like comparisons, length checking, and file handling.
+    like comparisons, arithmetic, length checking, and file handling.
+
+    Large string and binary values are spilled to the default `BlobStore` when it is enabled, and
+    are read back from it on access.
 
     Attributes:
         value: The value associated with the TypeEngine instance.
         iotype: The type of the value, represented as an object with metadata.
+        handle (BlobHandle or None): The handle of the spilled value, or None if the value is in memory.
+        _html_cache (dict or None): Rendered HTML of the value, kept by engines whose rendering is expensive.
+
+    Engines use `__slots__` to stay compact. Subclasses adding attributes should list them in their own `__slots__`.
     """
 
+    __slots__ = ('_value', 'handle', 'iotype', '_html_cache')
+
     def __init__(self, value, iotype):
         """
         Initializes a TypeEngine instance.
@@ -33,6 +43,34 @@ class TypeEngine(object):
         """
         self.value, self.iotype = value, iotype
 
+    @property
+    def value(self):
+        """
+        The value associated with this instance, read from the blob store if it was spilled.
+
+        Returns:
+            The value.
+        """
+        if self.handle is not None:
+            return self.handle.read()
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """
+        Sets the value, spilling it to the default blob store if it is large enough.
+
+        Args:
+            value: The new value.
+        """
+        if not isinstance(value, BlobHandle):
+            value = BlobStore.default().spill(value)
+        if isinstance(value, BlobHandle):
+            self.handle, self._value = value, None
+        else:
+            self.handle, self._value = None, value
+        self._html_cache = None
+
     def __repr__(self):
         """
         Returns a string representation of the TypeEngine instance.
@@ -49,6 +87,8 @@ class TypeEngine(object):
         Returns:
             int: The length of the value (if applicable).
         """
+        if self.handle is not None:
+            return len(self.handle)
         return len(self.value)
 
     def _binary_opt(self, other, func):
@@ -151,6 +191,192 @@ class TypeEngine(object):
         """
         return self._binary_opt(other, lambda a, b: b in a)
 
+    def __add__(self, other):
+        """
+        Adds the value and another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the sum.
+        """
+        return self._binary_opt(other, lambda a, b: a + b)
+
+    def __radd__(self, other):
+        """
+        Adds another value and the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the sum.
+        """
+        return self._binary_opt(other, lambda a, b: b + a)
+
+    def __sub__(self, other):
+        """
+        Subtracts another value from the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the difference.
+        """
+        return self._binary_opt(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        """
+        Subtracts the value from another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the difference.
+        """
+        return self._binary_opt(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        """
+        Multiplies the value and another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the product.
+        """
+        return self._binary_opt(other, lambda a, b: a * b)
+
+    def __rmul__(self, other):
+        """
+        Multiplies another value and the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the product.
+        """
+        return self._binary_opt(other, lambda a, b: b * a)
+
+    def __truediv__(self, other):
+        """
+        Divides the value by another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the quotient.
+        """
+        return self._binary_opt(other, lambda a, b: a / b)
+
+    def __rtruediv__(self, other):
+        """
+        Divides another value by the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the quotient.
+        """
+        return self._binary_opt(other, lambda a, b: b / a)
+
+    def __floordiv__(self, other):
+        """
+        Floor-divides the value by another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the floor quotient.
+        """
+        return self._binary_opt(other, lambda a, b: a // b)
+
+    def __rfloordiv__(self, other):
+        """
+        Floor-divides another value by the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the floor quotient.
+        """
+        return self._binary_opt(other, lambda a, b: b // a)
+
+    def __mod__(self, other):
+        """
+        Takes the remainder of dividing the value by another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the remainder.
+        """
+        return self._binary_opt(other, lambda a, b: a % b)
+
+    def __rmod__(self, other):
+        """
+        Takes the remainder of dividing another value by the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the remainder.
+        """
+        return self._binary_opt(other, lambda a, b: b % a)
+
+    def __pow__(self, other):
+        """
+        Raises the value to the power of another value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the power.
+        """
+        return self._binary_opt(other, lambda a, b: a ** b)
+
+    def __rpow__(self, other):
+        """
+        Raises another value to the power of the value.
+
+        Args:
+            other: The other object to operate on.
+
+        Returns:
+            The result, the power.
+        """
+        return self._binary_opt(other, lambda a, b: b ** a)
+
+    def __neg__(self):
+        """
+        Negates the value.
+
+        Returns:
+            The negated value.
+        """
+        return -self.value
+
+    def __abs__(self):
+        """
+        Takes the absolute value.
+
+        Returns:
+            The absolute value.
+        """
+        return abs(self.value)
+
     def _repr_markdown_(self):
         """
         Returns a Markdown representation of the TypeEngine instance.
@@ -193,4 +419,4 @@ class TypeEngine(object):
         Returns:
             FileUnit: A `FileUnit` object representing the value as a file.
         """
-        return FileUnit(data=self.value, name=name, ext=ext)
+        return FileUnit(data=self.value if self.handle is None else self.handle, name=name, ext=ext)
@@ -14,6 +14,7 @@ VERSION = '2.0.8'
 NAME = 'CalTable'
 
 install_requires = [
+    "numpy",
     "pandas",
     "tabulate",
     "easyaccess @ git+https://github.com/Jiarui0923/EasyAccess@1.0.3",
@@ -29,6 +30,7 @@ setup(
     version=VERSION,
     packages=find_packages(),
     install_requires=install_requires,
+    extras_require={'excel': ['openpyxl'], 'parquet': ['pyarrow']},
     url="https://github.com/Jiarui0923/CalTable",
     author='Jiarui Li, Marco K. Carbullido, Jai Bansal, Samuel J. Landry, Ramgopal R. Mettu',
     author_email=('jli78@tulane.edu'),
@@ -49,5 +51,7 @@ setup(
     platforms=["any"],
     entry_points={
         'caltable.extensions': [],
+        'caltable.blocks': [],
+        'caltable.engines': [],
     },
 )
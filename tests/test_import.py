@@ -0,0 +1,44 @@
+"""
+Import weight checks: `import caltable` must not import the heavy dependencies used only for plotting,
+reports, and sheet reading, and must finish within a time budget.
+
+The budget, in seconds, can be overridden with `CALTABLE_IMPORT_BUDGET`.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+HEAVY_MODULES = ['pandas', 'plotly', 'tabulate', 'docflow']
+
+_SCRIPT = '''
+import sys, time, json
+_start = time.perf_counter()
+import caltable
+_elapsed = time.perf_counter() - _start
+print(json.dumps({'elapsed': _elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+''' % (HEAVY_MODULES,)
+
+
+def _import_caltable():
+    """
+    Imports caltable in a fresh interpreter.
+
+    Returns:
+        dict: The import time in seconds ('elapsed') and the heavy modules that were imported ('loaded').
+    """
+    _root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    _env = dict(os.environ)
+    _env['PYTHONPATH'] = os.pathsep.join([_root] + [_path for _path in [_env.get('PYTHONPATH')] if _path])
+    _result = subprocess.run([sys.executable, '-c', _SCRIPT], capture_output=True, text=True, env=_env, check=True)
+    return json.loads(_result.stdout.strip().splitlines()[-1])
+
+
+def test_import_skips_heavy_modules():
+    assert _import_caltable()['loaded'] == []
+
+
+def test_import_time_budget():
+    _budget = float(os.environ.get('CALTABLE_IMPORT_BUDGET', 2.0))
+    assert _import_caltable()['elapsed'] < _budget